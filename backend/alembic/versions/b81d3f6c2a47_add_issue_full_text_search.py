@@ -0,0 +1,50 @@
+"""Add issue full-text search
+
+Revision ID: b81d3f6c2a47
+Revises: 7c2f4e9a1b3d
+Create Date: 2026-10-18 11:40:07.915326
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b81d3f6c2a47'
+down_revision = '7c2f4e9a1b3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('issues', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute("""
+        CREATE OR REPLACE FUNCTION issues_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER issues_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, description ON issues
+        FOR EACH ROW EXECUTE FUNCTION issues_search_vector_update()
+    """)
+    # Backfill existing rows before building the index
+    op.execute("""
+        UPDATE issues SET search_vector =
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    """)
+    op.create_index('ix_issues_search_vector', 'issues', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_issues_search_vector', table_name='issues', postgresql_using='gin')
+    op.execute("DROP TRIGGER IF EXISTS issues_search_vector_trigger ON issues")
+    op.execute("DROP FUNCTION IF EXISTS issues_search_vector_update()")
+    op.drop_column('issues', 'search_vector')
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from app.database import async_engine, engine, replica_router
+from app.models.user import User
+from app.dependencies import get_current_active_user
+from app.core.permissions import Permissions
+from app.core.pool_metrics import pool_stats
+from app.core.principal_cache import principal_cache
+from app.core.dashboard_cache import dashboard_cache
+
+router = APIRouter()
+
+def require_admin(current_user: User = Depends(get_current_active_user)) -> User:
+    if not Permissions.can_manage_users(current_user.role):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    return current_user
+
+@router.get("/db-pool")
+async def get_db_pool_stats(current_user: User = Depends(require_admin)):
+    return {
+        "api": pool_stats(async_engine),
+        "worker": pool_stats(engine),
+        "replicas": [pool_stats(replica) for replica in replica_router.engines] if replica_router else [],
+    }
+
+@router.get("/principal-cache")
+async def get_principal_cache_stats(current_user: User = Depends(require_admin)):
+    return principal_cache.stats()
+
+@router.get("/dashboard-cache")
+async def get_dashboard_cache_stats(current_user: User = Depends(require_admin)):
+    return dashboard_cache.stats()
+
+@router.get("/websockets")
+async def get_websocket_stats(current_user: User = Depends(require_admin)):
+    from app.main import websocket_manager
+    return websocket_manager.stats()
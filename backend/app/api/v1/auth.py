@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 from uuid import UUID
 
@@ -8,24 +9,30 @@ from app.database import get_db
 from app.models.user import User
 from app.schemas.auth import Token, LoginRequest
 from app.schemas.user import UserCreate, UserResponse
-from app.core.security import verify_password, get_password_hash, create_access_token, create_refresh_token
+from app.core.security import (
+    verify_password_async, get_password_hash_async, create_access_token, create_refresh_token, verify_token,
+    access_token_claims
+)
 from app.core.config import settings
 
 router = APIRouter()
 
 @router.post("/login", response_model=Token)
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == login_data.email).first()
-    if not user or not verify_password(login_data.password, user.hashed_password):
+async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_db)):
+    user = await db.scalar(select(User).where(User.email == login_data.email))
+    if not user or not await verify_password_async(login_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    # Stateless tokens are never checked against the user row, so they must not be minted
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data=access_token_claims(user), expires_delta=access_token_expires
     )
     refresh_token = create_refresh_token(data={"sub": user.email})
     
@@ -36,9 +43,9 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
     }
 
 @router.post("/register", response_model=UserResponse)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -46,7 +53,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     db_user = User(
         email=user_data.email,
         name=user_data.name,
@@ -55,13 +62,13 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     return db_user
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
+async def refresh_token(refresh_token: str, db: AsyncSession = Depends(get_db)):
     email = verify_token(refresh_token)
     if email is None:
         raise HTTPException(
@@ -69,16 +76,18 @@ async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
             detail="Invalid refresh token"
         )
     
-    user = db.query(User).filter(User.email == email).first()
+    user = await db.scalar(select(User).where(User.email == email))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data=access_token_claims(user), expires_delta=access_token_expires
     )
     new_refresh_token = create_refresh_token(data={"sub": user.email})
     
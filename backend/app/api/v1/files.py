@@ -1,7 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from fastapi.responses import FileResponse as FastAPIFileResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
 import os
+import uuid
 from uuid import UUID
 from typing import List
 
@@ -20,11 +23,11 @@ router = APIRouter()
 async def upload_file(
     issue_id: UUID,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     # Check if issue exists and user has permission
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    issue = await db.scalar(select(Issue).where(Issue.id == issue_id))
     if not issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -67,18 +70,20 @@ async def upload_file(
     )
     
     db.add(db_file)
-    db.commit()
-    db.refresh(db_file)
+    # Files are part of the issue payload, so they move its ETag
+    issue.updated_at = func.now()
+    await db.commit()
+    await db.refresh(db_file)
     
     return db_file
 
 @router.get("/{file_id}")
 async def download_file(
     file_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    file_record = db.query(IssueFile).filter(IssueFile.id == file_id).first()
+    file_record = await db.scalar(select(IssueFile).where(IssueFile.id == file_id))
     if not file_record:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -86,7 +91,7 @@ async def download_file(
         )
     
     # Check permissions through issue
-    issue = db.query(Issue).filter(Issue.id == file_record.issue_id).first()
+    issue = await db.scalar(select(Issue).where(Issue.id == file_record.issue_id))
     if not Permissions.can_view_issue(current_user.role, str(issue.reporter_id), str(current_user.id)):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -108,10 +113,10 @@ async def download_file(
 @router.delete("/{file_id}")
 async def delete_file(
     file_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    file_record = db.query(IssueFile).filter(IssueFile.id == file_id).first()
+    file_record = await db.scalar(select(IssueFile).where(IssueFile.id == file_id))
     if not file_record:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -119,7 +124,7 @@ async def delete_file(
         )
     
     # Check permissions
-    issue = db.query(Issue).filter(Issue.id == file_record.issue_id).first()
+    issue = await db.scalar(select(Issue).where(Issue.id == file_record.issue_id))
     if not Permissions.can_edit_issue(current_user.role, str(issue.reporter_id), str(current_user.id)):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -131,7 +136,8 @@ async def delete_file(
         os.remove(file_record.file_path)
     
     # Delete database record
-    db.delete(file_record)
-    db.commit()
+    await db.delete(file_record)
+    issue.updated_at = func.now()
+    await db.commit()
     
     return {"message": "File deleted successfully"}
\ No newline at end of file
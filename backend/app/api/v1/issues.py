@@ -1,27 +1,77 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from typing import List, Literal, Optional, Union
 from uuid import UUID
-from app.database import get_db
+from datetime import datetime
+from collections import Counter
+import csv
+import enum
+import io
+import json
+from app.database import get_db, get_read_db
 from app.models.user import User
 from app.models.issue import Issue, IssueStatus, IssueSeverity
-from app.schemas.issue import IssueCreate, IssueResponse, IssueUpdate
-from app.dependencies import get_current_active_user
+from app.models.issue_counter import upsert_counters
+from app.models.issue_event import creation_events, record_issue_events
+from app.schemas.issue import (
+    IssueCreate, IssueResponse, IssueUpdate, IssuePage, TagFacet,
+    IssueBulkCreate, IssueBulkUpdate, IssueBulkResponse, BulkItemError
+)
+from app.dependencies import get_current_active_user, get_current_principal, Principal
 from app.core.permissions import Permissions
-from app.workers.email_tasks import send_issue_notification_task
+from app.core.pagination import apply_keyset, encode_cursor, MAX_PAGE_SIZE, DEFAULT_PAGE_SIZE
+from app.core.search import search_issues, filter_by_tags, tag_facets_query
+from app.core.etag import weak_etag, etag_matches, not_modified
+from app.core.responses import ORJSONResponse, dump_model, dump_models
+from app.core.dashboard_cache import dashboard_cache
+from app.workers.email_tasks import send_issue_notification_task, send_issue_digest_task
 from app.models.user import UserRole
 
 router = APIRouter()
 
-@router.get("/", response_model=List[IssueResponse])
-async def get_issues(
-    status: Optional[IssueStatus] = None,
-    severity: Optional[IssueSeverity] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+# Relationships embedded in IssueResponse. Lists batch each one with an IN query;
+# single-issue reads join the many-to-one users into the same row.
+LIST_LOAD_OPTIONS = (
+    selectinload(Issue.reporter),
+    selectinload(Issue.assignee),
+    selectinload(Issue.files),
+)
+DETAIL_LOAD_OPTIONS = (
+    joinedload(Issue.reporter),
+    joinedload(Issue.assignee),
+    selectinload(Issue.files),
+)
+
+# Scalar columns that can be requested through ?fields= on the list endpoint
+SPARSE_FIELDS = (
+    "id", "title", "description", "severity", "status",
+    "reporter_id", "assignee_id", "tags", "created_at", "updated_at",
+)
+
+def parse_fields(fields: str) -> List[str]:
+    requested = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in requested if name not in SPARSE_FIELDS]
+    if not requested or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested"
+        )
+    return requested
+
+EXPORT_BATCH_SIZE = 1000
+
+def filter_issues(
+    query,
+    current_user: User,
+    status: Optional[IssueStatus],
+    severity: Optional[IssueSeverity],
+    tags: Optional[List[str]] = None,
+    tags_match: str = "any",
+    dialect: Optional[str] = None
 ):
-    query = db.query(Issue)
-    
     # Apply role-based filtering
     if not Permissions.can_view_all_issues(current_user.role):
         query = query.filter(Issue.reporter_id == current_user.id)
@@ -31,14 +81,174 @@ async def get_issues(
         query = query.filter(Issue.status == status)
     if severity:
         query = query.filter(Issue.severity == severity)
+    if tags:
+        query = filter_by_tags(query, tags, dialect, match_all=tags_match == "all")
+    return query
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    # str() of a str-mixin enum is "IssueStatus.OPEN", not its value
+    if isinstance(value, enum.Enum):
+        return value.value
+    return str(value)
+
+def _format_ndjson(rows) -> str:
+    return "".join(json.dumps(row._asdict(), default=_export_value) + "\n" for row in rows)
+
+def _format_csv(rows) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            ";".join(value) if isinstance(value, list) else _export_value(value) if value is not None else ""
+            for value in row
+        ])
+    return buffer.getvalue()
+
+async def stream_export(db: AsyncSession, query, export_format: str):
+    """Yield the export in chunks of EXPORT_BATCH_SIZE rows.
+
+    yield_per makes the driver use a server-side cursor, so only one batch is held in memory.
+    """
+    if export_format == "csv":
+        yield _format_csv([SPARSE_FIELDS])
+        formatter = _format_csv
+    else:
+        formatter = _format_ndjson
+    result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async for rows in result.partitions():
+        yield formatter(rows)
+
+async def load_issue(db: AsyncSession, issue_id) -> Optional[Issue]:
+    """Fetch one issue with everything IssueResponse embeds, overwriting any stale copy in the session"""
+    query = select(Issue).options(*DETAIL_LOAD_OPTIONS).where(Issue.id == issue_id)
+    return await db.scalar(query.execution_options(populate_existing=True))
+
+@router.get("/", response_model=Union[IssuePage, List[IssueResponse]])
+async def get_issues(
+    status: Optional[IssueStatus] = None,
+    severity: Optional[IssueSeverity] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Comma-separated columns, e.g. id,title,status,severity,assignee_id"),
+    q: Optional[str] = Query(None, min_length=1, description="Full-text search over title and description"),
+    tags: Optional[List[str]] = Query(None),
+    tags_match: Literal["any", "all"] = "any",
+    request: Request = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_principal)
+):
+    # Any write to the visible set moves its count or newest updated_at, so one
+    # aggregate decides whether the client's copy is still current
+    dialect = db.get_bind().dialect.name
+    state = select(func.count(Issue.id), func.max(Issue.updated_at)).select_from(Issue)
+    state = filter_issues(state, current_user, status, severity, tags, tags_match, dialect)
+    if q:
+        state = search_issues(state, q, dialect, ranked=False)
+    total, last_updated = (await db.execute(state)).one()
+    etag = weak_etag(current_user.id, request.url.query, total, last_updated)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
     
-    issues = query.all()
-    return issues
+    if fields:
+        # Projection mode: SELECT only the requested columns (plus the keyset columns),
+        # no description unless asked for and no relationship loads
+        selected = parse_fields(fields)
+        columns = dict.fromkeys(selected + ["created_at", "id"])
+        query = select(*[getattr(Issue, name) for name in columns])
+    else:
+        query = select(Issue).options(*LIST_LOAD_OPTIONS)
+    
+    query = filter_issues(query, current_user, status, severity, tags, tags_match, dialect)
+    
+    # Without cursor/limit keep returning the plain list for existing clients
+    paginated = cursor is not None or limit is not None
+    next_cursor = None
+    if q:
+        # Search results are ordered by rank, so only the first `limit` matches are paged
+        if cursor is not None:
+            raise HTTPException(status_code=400, detail="Cursor pagination is not supported with q")
+        query = search_issues(query, q, dialect)
+        if limit is not None:
+            query = query.limit(limit)
+    elif paginated:
+        page_size = limit or DEFAULT_PAGE_SIZE
+        query = apply_keyset(query, Issue.created_at, Issue.id, cursor, page_size)
+    
+    result = await db.execute(query)
+    issues = result.all() if fields else result.scalars().all()
+    if paginated and not q and len(issues) > page_size:
+        issues = issues[:page_size]
+        next_cursor = encode_cursor(issues[-1].created_at, issues[-1].id)
+    
+    if fields:
+        # Rows are plain tuples, so there is nothing to validate
+        items = [{name: getattr(row, name) for name in selected} for row in issues]
+    else:
+        items = dump_models(IssueResponse, issues)
+    content = {"items": items, "next_cursor": next_cursor} if paginated else items
+    return ORJSONResponse(content, headers={"ETag": etag})
+
+@router.get("/export")
+async def export_issues(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    status: Optional[IssueStatus] = None,
+    severity: Optional[IssueSeverity] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """Stream every visible issue as NDJSON or CSV without materializing the result set"""
+    query = select(*[getattr(Issue, name) for name in SPARSE_FIELDS])
+    query = filter_issues(query, current_user, status, severity).order_by(Issue.created_at, Issue.id)
+    
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        stream_export(db, query, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=issues.{export_format}"}
+    )
+
+@router.get("/tags/facets", response_model=List[TagFacet])
+async def get_tag_facets(
+    status: Optional[IssueStatus] = None,
+    severity: Optional[IssueSeverity] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """Issue count per tag over the issues visible to the current user"""
+    query = filter_issues(tag_facets_query(db.get_bind().dialect.name), current_user, status, severity)
+    return [TagFacet(tag=tag, count=count) for tag, count in (await db.execute(query)).all()]
+
+def apply_issue_update(issue: Issue, changes: dict, current_user: User):
+    for field, value in changes.items():
+        if field == "assignee_id" and not Permissions.can_assign_issues(current_user.role):
+            continue
+        setattr(issue, field, value)
+
+def issue_summary(issue: Issue) -> dict:
+    return {"id": str(issue.id), "title": issue.title, "status": issue.status.value}
+
+async def active_staff_emails(db: AsyncSession) -> List[str]:
+    admins_and_maintainers = (await db.scalars(select(User).where(
+        User.role.in_([UserRole.ADMIN, UserRole.MAINTAINER]),
+        User.is_active == True
+    ))).all()
+    return [user.email for user in admins_and_maintainers]
+
+def issue_watchers(issue: Issue) -> List[str]:
+    emails = []
+    if issue.reporter and issue.reporter.email:
+        emails.append(issue.reporter.email)
+    if issue.assignee and issue.assignee.email and issue.assignee.email not in emails:
+        emails.append(issue.assignee.email)
+    return emails
 
 @router.post("/", response_model=IssueResponse)
 async def create_issue(
     issue_data: IssueCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
     request: Request = None
 ):
@@ -57,15 +267,12 @@ async def create_issue(
     )
     
     db.add(db_issue)
-    db.commit()
-    db.refresh(db_issue)
+    await db.commit()
+    await dashboard_cache.invalidate([current_user.id])
+    db_issue = await load_issue(db, db_issue.id)
     
     # Email all ADMIN and MAINTAINER users
-    admins_and_maintainers = db.query(User).filter(
-        User.role.in_([UserRole.ADMIN, UserRole.MAINTAINER]),
-        User.is_active == True
-    ).all()
-    emails = [user.email for user in admins_and_maintainers]
+    emails = await active_staff_emails(db)
     if emails:
         send_issue_notification_task.delay(
             emails,
@@ -75,22 +282,163 @@ async def create_issue(
             "created"
         )
     
-    # Real-time broadcast
+    # Validated once; the same dict is the broadcast payload and the response body
+    issue_data = dump_model(IssueResponse, db_issue)
     from app.main import websocket_manager
     await websocket_manager.broadcast_issue_update({
         "action": "created",
-        "issue": IssueResponse.model_validate(db_issue).model_dump()
+        "issue": issue_data
+    })
+    
+    return ORJSONResponse(issue_data)
+
+@router.post("/bulk", response_model=IssueBulkResponse)
+async def bulk_create_issues(
+    payload: IssueBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Create many issues in one transaction with one notification and one broadcast"""
+    if not Permissions.can_create_issue(current_user.role):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    
+    rows = [
+        {
+            "title": item.title,
+            "description": item.description,
+            "severity": item.severity,
+            "tags": item.tags,
+            "reporter_id": current_user.id
+        }
+        for item in payload.items
+    ]
+    # A single executemany INSERT ... RETURNING instead of one round trip per issue
+    issue_ids = (await db.scalars(insert(Issue).returning(Issue.id, sort_by_parameter_order=True), rows)).all()
+    # Core INSERTs bypass the flush hooks that maintain issue_counters and issue_events
+    counts = Counter((current_user.id, IssueStatus.OPEN, row["severity"]) for row in rows)
+    events = [
+        event
+        for issue_id, row in zip(issue_ids, rows)
+        for event in creation_events(issue_id, {**row, "status": IssueStatus.OPEN})
+    ]
+    connection = await db.connection()
+    await connection.run_sync(upsert_counters, counts)
+    await connection.run_sync(record_issue_events, events)
+    await db.commit()
+    await dashboard_cache.invalidate([current_user.id])
+    
+    query = select(Issue).options(*LIST_LOAD_OPTIONS).where(Issue.id.in_(issue_ids))
+    loaded = {issue.id: issue for issue in (await db.scalars(query)).all()}
+    issues = [loaded[issue_id] for issue_id in issue_ids]
+    
+    emails = await active_staff_emails(db)
+    if emails:
+        summaries = [issue_summary(issue) for issue in issues]
+        send_issue_digest_task.delay({email: summaries for email in emails}, "created")
+    
+    issue_data = dump_models(IssueResponse, issues)
+    from app.main import websocket_manager
+    await websocket_manager.broadcast_issue_update({
+        "action": "bulk_created",
+        "issues": issue_data
     })
     
-    return db_issue
+    return ORJSONResponse({"issues": issue_data, "errors": []})
+
+@router.patch("/bulk", response_model=IssueBulkResponse)
+async def bulk_update_issues(
+    payload: IssueBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Apply many issue updates in one transaction; items that fail are reported, not fatal"""
+    requested_ids = {item.id for item in payload.items}
+    query = select(Issue).options(*LIST_LOAD_OPTIONS).where(Issue.id.in_(requested_ids))
+    issues = {issue.id: issue for issue in (await db.scalars(query)).all()}
+    old_statuses = {issue_id: issue.status for issue_id, issue in issues.items()}
+    # An unknown assignee would fail the foreign key and abort every item at commit
+    existing_assignees = set()
+    if Permissions.can_assign_issues(current_user.role):
+        requested_assignees = {item.assignee_id for item in payload.items if item.assignee_id is not None}
+        if requested_assignees:
+            existing_assignees = set((await db.scalars(select(User.id).where(User.id.in_(requested_assignees)))).all())
+    
+    errors = []
+    updated_ids = []
+    for index, item in enumerate(payload.items):
+        issue = issues.get(item.id)
+        if issue is None:
+            errors.append(BulkItemError(index=index, id=item.id, detail="Issue not found").model_dump())
+            continue
+        if not Permissions.can_edit_issue(current_user.role, str(issue.reporter_id), str(current_user.id)):
+            errors.append(BulkItemError(index=index, id=item.id, detail="Not enough permissions").model_dump())
+            continue
+        if (
+            item.assignee_id is not None
+            and Permissions.can_assign_issues(current_user.role)
+            and item.assignee_id not in existing_assignees
+        ):
+            errors.append(BulkItemError(index=index, id=item.id, detail="Assignee not found").model_dump())
+            continue
+        apply_issue_update(issue, item.dict(exclude_unset=True, exclude={"id"}), current_user)
+        if item.id not in updated_ids:
+            updated_ids.append(item.id)
+    
+    # The unit of work batches the UPDATEs into executemany calls within this one commit
+    await db.commit()
+    if updated_ids:
+        await dashboard_cache.invalidate(issues[issue_id].reporter_id for issue_id in updated_ids)
+    
+    if not updated_ids:
+        return ORJSONResponse({"issues": [], "errors": errors})
+    
+    query = select(Issue).options(*LIST_LOAD_OPTIONS).where(Issue.id.in_(updated_ids))
+    loaded = {
+        issue.id: issue
+        for issue in (await db.scalars(query.execution_options(populate_existing=True))).all()
+    }
+    updated = [loaded[issue_id] for issue_id in updated_ids]
+    
+    # One digest per watcher covering every issue whose status changed
+    recipients = {}
+    for issue in updated:
+        if issue.status != old_statuses[issue.id]:
+            for email in issue_watchers(issue):
+                recipients.setdefault(email, []).append(issue_summary(issue))
+    if recipients:
+        send_issue_digest_task.delay(recipients, "updated")
+    
+    issue_data = dump_models(IssueResponse, updated)
+    from app.main import websocket_manager
+    await websocket_manager.broadcast_issue_update({
+        "action": "bulk_updated",
+        "issues": issue_data
+    })
+    
+    return ORJSONResponse({"issues": issue_data, "errors": errors})
+
+def issue_etag(issue_id, updated_at) -> str:
+    return weak_etag(issue_id, updated_at)
 
 @router.get("/{issue_id}", response_model=IssueResponse)
 async def get_issue(
     issue_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_principal)
 ):
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    if if_none_match:
+        # Revalidation: answer from the two columns we need before loading the issue
+        row = (await db.execute(select(Issue.updated_at, Issue.reporter_id).where(Issue.id == issue_id))).first()
+        if row and Permissions.can_view_issue(current_user.role, str(row.reporter_id), str(current_user.id)):
+            etag = issue_etag(issue_id, row.updated_at)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+    
+    issue = await load_issue(db, issue_id)
     if not issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -103,17 +451,17 @@ async def get_issue(
             detail="Not enough permissions"
         )
     
-    return issue
+    return ORJSONResponse(dump_model(IssueResponse, issue), headers={"ETag": issue_etag(issue.id, issue.updated_at)})
 
 @router.put("/{issue_id}", response_model=IssueResponse)
 async def update_issue(
     issue_id: UUID,
     issue_update: IssueUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
     request: Request = None
 ):
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    issue = await load_issue(db, issue_id)
     if not issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -129,21 +477,17 @@ async def update_issue(
     # Track status change
     old_status = issue.status
     # Update issue fields
-    for field, value in issue_update.dict(exclude_unset=True).items():
-        if field == "assignee_id" and not Permissions.can_assign_issues(current_user.role):
-            continue
-        setattr(issue, field, value)
+    apply_issue_update(issue, issue_update.dict(exclude_unset=True), current_user)
     
-    db.commit()
-    db.refresh(issue)
+    await db.commit()
+    if {"status", "severity"} & issue_update.dict(exclude_unset=True).keys():
+        await dashboard_cache.invalidate([issue.reporter_id])
+    # Reload with relationships in one round trip instead of refresh + lazy loads
+    issue = await load_issue(db, issue_id)
     
     # If status changed, email reporter and assignee
     if "status" in issue_update.dict(exclude_unset=True) and issue.status != old_status:
-        emails = []
-        if issue.reporter and issue.reporter.email:
-            emails.append(issue.reporter.email)
-        if issue.assignee and issue.assignee.email and issue.assignee.email not in emails:
-            emails.append(issue.assignee.email)
+        emails = issue_watchers(issue)
         if emails:
             send_issue_notification_task.delay(
                 emails,
@@ -153,22 +497,23 @@ async def update_issue(
                 f"status changed to {issue.status.value}"
             )
     
-    # Real-time broadcast on status change or update
+    # Real-time broadcast on status change or update, reusing the response body
+    issue_data = dump_model(IssueResponse, issue)
     from app.main import websocket_manager
     await websocket_manager.broadcast_issue_update({
         "action": "updated",
-        "issue": IssueResponse.model_validate(issue).model_dump()
+        "issue": issue_data
     })
     
-    return issue
+    return ORJSONResponse(issue_data)
 
 @router.delete("/{issue_id}")
 async def delete_issue(
     issue_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+    issue = await db.scalar(select(Issue).where(Issue.id == issue_id))
     if not issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -187,7 +532,8 @@ async def delete_issue(
             detail="Not enough permissions"
         )
     
-    db.delete(issue)
-    db.commit()
+    await db.delete(issue)
+    await db.commit()
+    await dashboard_cache.invalidate([issue.reporter_id])
     
     return {"message": "Issue deleted successfully"}
\ No newline at end of file
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from pydantic import BaseModel, EmailStr
 
@@ -21,7 +22,7 @@ class BulkNotificationRequest(BaseModel):
 @router.post("/send-bulk")
 async def send_bulk_notification(
     notification: BulkNotificationRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """Send bulk notification to users"""
@@ -38,10 +39,10 @@ async def send_bulk_notification(
         recipient_emails.extend(notification.recipient_emails)
     
     if notification.recipient_roles:
-        users = db.query(User).filter(
+        users = (await db.scalars(select(User).where(
             User.role.in_(notification.recipient_roles),
             User.is_active == True
-        ).all()
+        ))).all()
         recipient_emails.extend([user.email for user in users])
     
     if not recipient_emails:
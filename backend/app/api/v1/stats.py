@@ -1,51 +1,169 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, timedelta
+from typing import Literal, Optional
 
-from app.database import get_db
-from app.models.user import User
+from app.database import get_db, get_read_db
 from app.models.issue import Issue, IssueStatus, IssueSeverity
-from app.schemas.stats import DashboardStats
-from app.dependencies import get_current_active_user
+from app.models.issue_counter import IssueCounter
+from app.models.daily_stats import DailyStats
+from app.models.lead_time import LeadTimeBucket, histogram_quantile
+from app.models.stats_rollup import StatsRollup, SNAPSHOT_COLUMNS, period_start
+from app.schemas.stats import DashboardStats, StatsTimeSeries, LeadTimeStats, TagCooccurrence, TagTrends
+from app.dependencies import get_current_principal, Principal
 from app.core.permissions import Permissions
+from app.core.dashboard_cache import dashboard_cache, GLOBAL_SCOPE, reporter_scope
+from app.core.analytics import (
+    tag_analytics_cache, tag_cooccurrence, tag_trends, week_number
+)
 
 router = APIRouter()
 
+DEFAULT_TIMESERIES_DAYS = 90
+
+def dashboard_stats_from_counts(rows) -> DashboardStats:
+    """Fold (status, severity, count) rows into DashboardStats, zero-filling missing combinations"""
+    status_stats = {status.value: 0 for status in IssueStatus}
+    severity_stats = {severity.value: 0 for severity in IssueSeverity}
+    for issue_status, issue_severity, n in rows:
+        status_stats[issue_status.value] += n
+        severity_stats[issue_severity.value] += n
+    
+    return DashboardStats(
+        total_issues=sum(status_stats.values()),
+        open_issues=status_stats[IssueStatus.OPEN.value],
+        in_progress_issues=status_stats[IssueStatus.IN_PROGRESS.value],
+        closed_issues=status_stats[IssueStatus.DONE.value],
+        issues_by_severity=severity_stats,
+        issues_by_status=status_stats
+    )
+
 @router.get("/dashboard", response_model=DashboardStats)
 async def get_dashboard_stats(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    # Not get_read_db: the result is cached under the current epoch, so it must not be a lagging replica's
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal)
 ):
-    # Base query
-    query = db.query(Issue)
+    # issue_counters holds at most 16 rows per reporter, so this never scans issues and a
+    # reporter's dashboard is a range scan on the (reporter_id, status, severity) primary key
+    query = select(IssueCounter.status, IssueCounter.severity, func.sum(IssueCounter.count))
+    query = query.group_by(IssueCounter.status, IssueCounter.severity)
     
     # Apply role-based filtering
+    if Permissions.can_view_all_issues(current_user.role):
+        scope = GLOBAL_SCOPE
+    else:
+        scope = reporter_scope(current_user.id)
+        query = query.where(IssueCounter.reporter_id == current_user.id)
+    
+    async def compute():
+        return dashboard_stats_from_counts((await db.execute(query)).all()).model_dump()
+    
+    return await dashboard_cache.get_or_compute(scope, compute)
+
+def require_all_issues(current_user: Principal = Depends(get_current_principal)) -> Principal:
+    """Reports built from every issue (snapshots, lead times, tag analytics) need a role that sees every issue"""
     if not Permissions.can_view_all_issues(current_user.role):
-        query = query.filter(Issue.reporter_id == current_user.id)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    return current_user
+
+@router.get("/timeseries", response_model=StatsTimeSeries)
+async def get_stats_timeseries(
+    start: Optional[date] = Query(None, alias="from"),
+    end: Optional[date] = Query(None, alias="to"),
+    bucket: Literal["day", "week", "month"] = "day",
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(require_all_issues)
+):
+    """Issue counts over time from daily_stats, or from the week/month rollups the worker maintains"""
+    end = end or date.today()
+    start = start or end - timedelta(days=DEFAULT_TIMESERIES_DAYS)
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must not be after 'to'"
+        )
     
-    # Total issues
-    total_issues = query.count()
+    if bucket == "day":
+        query = select(DailyStats).where(DailyStats.date.between(start, end)).order_by(DailyStats.date)
+    else:
+        # A period is included when it overlaps the range
+        query = select(StatsRollup).where(
+            StatsRollup.period == bucket,
+            StatsRollup.period_start.between(period_start(start, bucket), end)
+        ).order_by(StatsRollup.period_start)
     
-    # Issues by status
-    open_issues = query.filter(Issue.status == IssueStatus.OPEN).count()
-    in_progress_issues = query.filter(Issue.status == IssueStatus.IN_PROGRESS).count()
-    closed_issues = query.filter(Issue.status == IssueStatus.DONE).count()
+    points = [
+        {
+            "period_start": row.date if bucket == "day" else row.period_start,
+            "date": row.date,
+            **{column: getattr(row, column) for column in SNAPSHOT_COLUMNS}
+        }
+        for row in (await db.scalars(query)).all()
+    ]
+    return {"bucket": bucket, "points": points}
+
+@router.get("/lead-time", response_model=LeadTimeStats)
+async def get_lead_time_stats(
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(require_all_issues)
+):
+    """Median and p90 time to DONE per severity, from the histograms the worker folds out of issue_events"""
+    histograms = {severity: {} for severity in IssueSeverity}
+    for row in (await db.scalars(select(LeadTimeBucket))).all():
+        histograms[row.severity][row.bucket] = row.count
     
-    # Issues by severity
-    severity_stats = {}
-    for severity in IssueSeverity:
-        severity_stats[severity.value] = query.filter(Issue.severity == severity).count()
+    def hours(seconds):
+        return round(seconds / 3600, 2) if seconds is not None else None
     
-    # Issues by status (detailed)
-    status_stats = {}
-    for status in IssueStatus:
-        status_stats[status.value] = query.filter(Issue.status == status).count()
+    return {
+        "by_severity": {
+            severity.value: {
+                "resolved": sum(counts.values()),
+                "median_hours": hours(histogram_quantile(counts, 0.5)),
+                "p90_hours": hours(histogram_quantile(counts, 0.9)),
+            }
+            for severity, counts in histograms.items()
+        }
+    }
+
+async def tag_report(db: AsyncSession, key, compute) -> dict:
+    """Run compute over the cached tag arrays, reloading them after each daily stats aggregation"""
+    generation = await db.scalar(select(DailyStats.updated_at).order_by(DailyStats.date.desc()).limit(1))
     
-    return DashboardStats(
-        total_issues=total_issues,
-        open_issues=open_issues,
-        in_progress_issues=in_progress_issues,
-        closed_issues=closed_issues,
-        issues_by_severity=severity_stats,
-        issues_by_status=status_stats
-    )
\ No newline at end of file
+    async def load():
+        return (await db.execute(select(Issue.tags, Issue.created_at))).all()
+    
+    return await tag_analytics_cache.report(generation, key, load, compute)
+
+@router.get("/tags/cooccurrence", response_model=TagCooccurrence)
+async def get_tag_cooccurrence(
+    top: int = Query(20, ge=2, le=100),
+    pairs: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(require_all_issues)
+):
+    """How often each pair of the `top` most used tags appears on the same issue"""
+    return await tag_report(
+        db, ("cooccurrence", top, pairs),
+        lambda arrays: tag_cooccurrence(arrays, top, pairs)
+    )
+
+@router.get("/tags/trends", response_model=TagTrends)
+async def get_tag_trends(
+    weeks: int = Query(8, ge=2, le=104),
+    window: int = Query(4, ge=1, le=52),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(require_all_issues)
+):
+    """New issues per tag per week, fastest growing first, over complete weeks only"""
+    last_week = week_number(date.today()) - 1
+    return await tag_report(
+        db, ("trends", last_week, weeks, window, limit),
+        lambda arrays: tag_trends(arrays, last_week, weeks, window, limit)
+    )
@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from uuid import UUID
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models.user import User, UserRole
 from app.schemas.user import UserResponse, UserUpdate
-from app.dependencies import get_current_active_user
+from app.dependencies import get_current_active_user, get_current_principal, Principal
 from app.core.permissions import Permissions
+from app.core.principal_cache import principal_cache
+from app.core.revocation import token_revocations
 
 router = APIRouter()
 
@@ -16,8 +19,8 @@ async def get_current_user_info(current_user: User = Depends(get_current_active_
 
 @router.get("/", response_model=List[UserResponse])
 async def get_users(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_principal)
 ):
     if not Permissions.can_manage_users(current_user.role):
         raise HTTPException(
@@ -25,14 +28,14 @@ async def get_users(
             detail="Not enough permissions"
         )
     
-    users = db.query(User).all()
+    users = (await db.scalars(select(User))).all()
     return users
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal)
 ):
     if not Permissions.can_manage_users(current_user.role) and str(current_user.id) != user_id:
         raise HTTPException(
@@ -40,7 +43,7 @@ async def get_user(
             detail="Not enough permissions"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -51,18 +54,18 @@ async def get_user(
 
 @router.put("/{user_id}", response_model=UserResponse)
 async def update_user(
-    user_id: str,
+    user_id: UUID,
     user_update: UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    if not Permissions.can_manage_users(current_user.role) and str(current_user.id) != user_id:
+    if not Permissions.can_manage_users(current_user.role) and current_user.id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -70,10 +73,18 @@ async def update_user(
         )
     
     # Update user fields
-    for field, value in user_update.dict(exclude_unset=True).items():
+    changes = user_update.dict(exclude_unset=True)
+    revoke_tokens = any(field in changes and changes[field] != getattr(user, field) for field in ("role", "is_active"))
+    for field, value in changes.items():
         setattr(user, field, value)
+    if revoke_tokens:
+        user.token_version = User.token_version + 1
     
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    # Role and is_active changes must take effect on the user's next request
+    await principal_cache.invalidate(user.email)
+    if revoke_tokens:
+        await token_revocations.revoke_before(user.id, user.token_version)
     
     return user
\ No newline at end of file
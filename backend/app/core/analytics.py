@@ -0,0 +1,157 @@
+import asyncio
+import itertools
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+import numpy as np
+
+# Issues per block when accumulating co-occurrence, bounding the dense indicator matrix
+COOCCURRENCE_CHUNK = 65536
+
+@dataclass(frozen=True)
+class TagArrays:
+    """Every tag occurrence as parallel arrays: which tag, on which issue, in which week.
+
+    Tags are encoded as int32 ids into `vocabulary` (sorted). Occurrences are ordered by
+    issue, and weeks are counted in Mondays since 0001-01-01, matching week_number().
+    """
+    vocabulary: np.ndarray
+    tag_ids: np.ndarray
+    issue_ids: np.ndarray
+    weeks: np.ndarray
+    issue_count: int
+
+def week_number(day: date) -> int:
+    return (day.toordinal() - 1) // 7
+
+def week_start(week: int) -> date:
+    return date.fromordinal(week * 7 + 1)
+
+def load_tag_arrays(rows: Iterable) -> TagArrays:
+    """Encode (tags, created_at) rows; this is the only per-issue Python loop"""
+    tag_lists, weeks = [], []
+    for tags, created_at in rows:
+        tag_lists.append(tags or ())
+        weeks.append(week_number(created_at))
+    lengths = np.fromiter(map(len, tag_lists), dtype=np.int64, count=len(tag_lists))
+    flat = np.fromiter(itertools.chain.from_iterable(tag_lists), dtype=object, count=int(lengths.sum()))
+    vocabulary, tag_ids = np.unique(flat, return_inverse=True)
+    issue_ids = np.repeat(np.arange(len(tag_lists), dtype=np.int32), lengths)
+    return TagArrays(
+        vocabulary=vocabulary,
+        tag_ids=tag_ids.astype(np.int32).reshape(-1),
+        issue_ids=issue_ids,
+        weeks=np.repeat(np.asarray(weeks, dtype=np.int32), lengths),
+        issue_count=len(tag_lists),
+    )
+
+def tag_cooccurrence(arrays: TagArrays, top: int, pair_limit: int) -> dict:
+    """Issue counts for every pair among the top most used tags; the diagonal is each tag's total"""
+    totals = np.bincount(arrays.tag_ids, minlength=len(arrays.vocabulary))
+    top_ids = np.argsort(-totals, kind="stable")[:top]
+    top_ids = top_ids[totals[top_ids] > 0]
+    size = len(top_ids)
+    column = np.full(len(arrays.vocabulary), -1, dtype=np.int32)
+    column[top_ids] = np.arange(size, dtype=np.int32)
+
+    columns = column[arrays.tag_ids]
+    kept = columns >= 0
+    issue_ids, columns = arrays.issue_ids[kept], columns[kept]
+
+    # Counts are summed as X.T @ X over blocks of a 0/1 issue-by-tag matrix X
+    matrix = np.zeros((size, size), dtype=np.int64)
+    for start in range(0, arrays.issue_count, COOCCURRENCE_CHUNK):
+        stop = min(start + COOCCURRENCE_CHUNK, arrays.issue_count)
+        lo, hi = np.searchsorted(issue_ids, [start, stop])
+        if lo == hi:
+            continue
+        block = np.zeros((stop - start, size), dtype=np.float32)
+        block[issue_ids[lo:hi] - start, columns[lo:hi]] = 1
+        matrix += np.rint(block.T @ block).astype(np.int64)
+
+    rows, cols = np.triu_indices(size, 1)
+    pair_counts = matrix[rows, cols]
+    order = np.argsort(-pair_counts, kind="stable")[:pair_limit]
+    order = order[pair_counts[order] > 0]
+    tags = arrays.vocabulary[top_ids].tolist()
+    return {
+        "tags": tags,
+        "counts": matrix.tolist(),
+        "pairs": [
+            {"tags": [tags[rows[i]], tags[cols[i]]], "count": int(pair_counts[i])}
+            for i in order
+        ],
+    }
+
+def tag_trends(arrays: TagArrays, last_week: int, weeks: int, window: int, limit: int) -> dict:
+    """Weekly counts per tag over the weeks ending at last_week, ranked by week-over-week change"""
+    first_week = last_week - weeks + 1
+    offsets = arrays.weeks - first_week
+    kept = (offsets >= 0) & (offsets < weeks)
+    cells = arrays.tag_ids[kept].astype(np.int64) * weeks + offsets[kept]
+    counts = np.bincount(cells, minlength=len(arrays.vocabulary) * weeks).reshape(-1, weeks)
+
+    # Rolling mean over up to `window` weeks ending at each week
+    cumulative = np.pad(np.cumsum(counts, axis=1), ((0, 0), (1, 0)))
+    ends = np.arange(1, weeks + 1)
+    starts = np.maximum(ends - window, 0)
+    rolling = (cumulative[:, ends] - cumulative[:, starts]) / (ends - starts)
+
+    previous, current = counts[:, -2], counts[:, -1]
+    change = current - previous
+    growth = change / np.maximum(previous, 1)
+    active = np.flatnonzero(counts.any(axis=1))
+    # Largest absolute change first (a drop ranks like a rise), relative growth breaking ties
+    order = active[np.lexsort((-growth[active], -np.abs(change[active])))][:limit]
+    return {
+        "weeks": [week_start(week) for week in range(first_week, last_week + 1)],
+        "window": window,
+        "tags": [
+            {
+                "tag": arrays.vocabulary[i],
+                "counts": counts[i].tolist(),
+                "rolling_mean": np.round(rolling[i], 2).tolist(),
+                "change": int(change[i]),
+                "growth": round(float(growth[i]), 4),
+            }
+            for i in order
+        ],
+    }
+
+class TagAnalyticsCache:
+    """Tag arrays and the reports computed from them, kept per aggregation generation.
+
+    The generation is the time daily stats were last aggregated, so everything is reloaded
+    once after each aggregate_daily_stats run. Encoding the rows and computing reports both
+    run in a worker thread, keeping the event loop free during the per-issue loop and NumPy.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._generation = None
+        self._arrays: Optional[TagArrays] = None
+        self._reports: Dict[Any, dict] = {}
+
+    async def report(
+        self,
+        generation,
+        key,
+        load: Callable[[], Awaitable[Iterable]],
+        compute: Callable[[TagArrays], dict],
+    ) -> dict:
+        async with self._lock:
+            if self._arrays is None or generation != self._generation:
+                self._arrays = await asyncio.to_thread(load_tag_arrays, await load())
+                self._generation = generation
+                self._reports = {}
+            if key not in self._reports:
+                self._reports[key] = await asyncio.to_thread(compute, self._arrays)
+            return self._reports[key]
+
+    def clear(self):
+        self._generation = None
+        self._arrays = None
+        self._reports = {}
+
+tag_analytics_cache = TagAnalyticsCache()
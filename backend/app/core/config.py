@@ -5,15 +5,45 @@ import os
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    DATABASE_REPLICA_URLS: Optional[str] = None  # comma-separated read replicas
+    DB_REPLICA_RETRY_SECONDS: int = 30  # how long a replica that failed to connect is skipped
     
     # Redis
     REDIS_URL: str = os.getenv("REDIS_URL")
     
+    # Authenticated user cache (PRINCIPAL_CACHE_REDIS shares it and its invalidations across workers)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    PRINCIPAL_CACHE_REDIS: bool = False
+    
+    # Dashboard stats cache in Redis, invalidated by issue writes
+    DASHBOARD_CACHE_ENABLED: bool = True
+    DASHBOARD_CACHE_TTL_SECONDS: int = 300
+    
     # JWT
     SECRET_KEY: str = os.getenv("SECRET_KEY")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Authorize read-only endpoints from the id/role/version claims without loading the user;
+    # token revocations are then kept in REDIS_URL so every worker honours them
+    STATELESS_AUTH: bool = False
+    
+    # bcrypt runs on its own thread pool; requests beyond workers + queue get a 429
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 64
+    
+    # WebSocket clients get a bounded send queue; one that overflows or stalls a send is dropped
+    WEBSOCKET_QUEUE_SIZE: int = 100
+    WEBSOCKET_SEND_TIMEOUT_SECONDS: float = 10
+    # "memory" reaches this process's clients only; "redis" relays broadcasts to every worker
+    WEBSOCKET_BACKPLANE: str = "memory"
+    WEBSOCKET_BACKPLANE_CHANNEL: str = "websocket:broadcast"
     
     # OAuth
     GOOGLE_CLIENT_ID: Optional[str] = None
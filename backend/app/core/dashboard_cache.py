@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import time
+from functools import partial
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+import orjson
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_SCOPE = "global"
+
+def reporter_scope(reporter_id) -> str:
+    return f"reporter:{reporter_id}"
+
+class DashboardCache:
+    """DashboardStats payloads in Redis, one entry per scope (global or per reporter).
+
+    Every scope has a version counter that issue writes bump after they commit. An entry
+    records the version it was computed under and is only served while that version is
+    still current, so a reader that started before a write can never put stale numbers
+    back. Concurrent misses for a scope within a worker share a single computation.
+    If Redis is unreachable, reads skip it for retry_after seconds and stats are computed
+    directly. Invalidations are always attempted; one that fails bumps a global epoch,
+    part of every entry's version, on the next successful call, so nothing cached before
+    the outage is served afterwards.
+    """
+
+    def __init__(self, redis_url: Optional[str], ttl: int, retry_after: float = 30):
+        self._redis = aioredis.from_url(redis_url) if redis_url else None
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self._down_until = 0.0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # An invalidation was lost to a Redis failure and the epoch still has to be bumped
+        self._missed_invalidation = False
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_key(self, scope: str) -> str:
+        return f"dashboard:{scope}"
+
+    def _version_key(self, scope: str) -> str:
+        return f"dashboard:version:{scope}"
+
+    def _epoch_key(self) -> str:
+        return "dashboard:epoch"
+
+    def _available(self) -> bool:
+        return self._redis is not None and self._down_until <= time.monotonic()
+
+    def _failed(self, e: RedisError):
+        logger.warning(f"Dashboard cache Redis unavailable: {str(e)}")
+        self._down_until = time.monotonic() + self.retry_after
+
+    async def get_or_compute(self, scope: str, compute: Callable[[], Awaitable[dict]]) -> dict:
+        """Cached stats for scope, or the result of compute() shared by every concurrent caller"""
+        inflight = self._inflight.get(scope)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._load(scope, compute))
+            self._inflight[scope] = inflight
+            inflight.add_done_callback(partial(self._forget, scope))
+        return await asyncio.shield(inflight)
+
+    def _forget(self, scope: str, done: asyncio.Future):
+        if self._inflight.get(scope) is done:
+            del self._inflight[scope]
+
+    async def _load(self, scope: str, compute: Callable[[], Awaitable[dict]]) -> dict:
+        version = None
+        if self._available():
+            try:
+                await self._bump_epoch_if_missed()
+                epoch, version, cached = await self._redis.mget(
+                    self._epoch_key(), self._version_key(scope), self._entry_key(scope)
+                )
+            except RedisError as e:
+                self._failed(e)
+                version = None
+            else:
+                version = f"{int(epoch or 0)}:{int(version or 0)}"
+                if cached is not None:
+                    entry = orjson.loads(cached)
+                    if entry["version"] == version:
+                        self.hits += 1
+                        return entry["stats"]
+
+        self.misses += 1
+        stats = await compute()
+        if version is not None:
+            try:
+                payload = orjson.dumps({"version": version, "stats": stats})
+                await self._redis.set(self._entry_key(scope), payload, ex=self.ttl)
+            except RedisError as e:
+                self._failed(e)
+        return stats
+
+    async def _bump_epoch_if_missed(self):
+        if self._missed_invalidation:
+            await self._redis.incr(self._epoch_key())
+            self._missed_invalidation = False
+
+    async def invalidate(self, reporter_ids: Iterable):
+        """Bump the global scope and each reporter's scope after issues by reporter_ids changed"""
+        if self._redis is None:
+            return
+        # Attempted even while reads skip Redis: a skipped bump would let entries cached
+        # before an outage be served as current once Redis is back
+        scopes = [GLOBAL_SCOPE] + [reporter_scope(reporter_id) for reporter_id in set(reporter_ids)]
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                if self._missed_invalidation:
+                    pipe.incr(self._epoch_key())
+                for scope in scopes:
+                    pipe.incr(self._version_key(scope))
+                await pipe.execute()
+        except RedisError as e:
+            self._missed_invalidation = True
+            self._failed(e)
+        else:
+            self._missed_invalidation = False
+            self._down_until = 0.0
+
+    def stats(self) -> dict:
+        return {"redis": self._available(), "ttl_seconds": self.ttl, "hits": self.hits, "misses": self.misses}
+
+dashboard_cache = DashboardCache(
+    settings.REDIS_URL if settings.DASHBOARD_CACHE_ENABLED else None,
+    settings.DASHBOARD_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,21 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Response, status
+
+def weak_etag(*parts) -> str:
+    """Build a weak validator from anything that changes whenever the payload does"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison against an If-None-Match header, as required for GET"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,38 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+def encode_cursor(created_at: datetime, issue_id: UUID) -> str:
+    """Encode the (created_at, id) keyset position of the last row as an opaque token"""
+    payload = json.dumps([created_at.isoformat(), str(issue_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a token produced by encode_cursor, rejecting anything malformed with a 400"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, issue_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), UUID(issue_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+def apply_keyset(query, created_at_column, id_column, cursor: Optional[str], limit: int):
+    """Order newest first and seek past the cursor, so any page costs one index range scan.
+
+    One extra row is fetched so callers can tell whether another page exists.
+    """
+    if cursor:
+        created_at, issue_id = decode_cursor(cursor)
+        query = query.filter(tuple_(created_at_column, id_column) < tuple_(created_at, issue_id))
+    return query.order_by(created_at_column.desc(), id_column.desc()).limit(limit + 1)
@@ -0,0 +1,78 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds (ms) of the connection wait histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+class PoolWaitHistogram:
+    """Thread-safe histogram of how long callers waited to get a pooled connection"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._sum_ms = 0.0
+        self._timeouts = 0
+
+    def observe(self, seconds: float):
+        waited_ms = seconds * 1000
+        index = next((i for i, bound in enumerate(WAIT_BUCKETS_MS) if waited_ms <= bound), len(WAIT_BUCKETS_MS))
+        with self._lock:
+            self._counts[index] += 1
+            self._sum_ms += waited_ms
+
+    def record_timeout(self):
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            sum_ms = self._sum_ms
+            timeouts = self._timeouts
+        # Cumulative buckets, Prometheus style
+        buckets = {}
+        running = 0
+        for bound, count in zip([str(bound) for bound in WAIT_BUCKETS_MS] + ["+Inf"], counts):
+            running += count
+            buckets[bound] = running
+        return {"buckets_ms": buckets, "count": running, "sum_ms": round(sum_ms, 3), "timeouts": timeouts}
+
+class _InstrumentedPoolMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_histogram = PoolWaitHistogram()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.wait_histogram.record_timeout()
+            raise
+        self.wait_histogram.observe(time.perf_counter() - started)
+        return connection
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+def pool_stats(engine) -> dict:
+    """Live occupancy of an engine's pool plus its wait histogram when instrumented"""
+    pool = engine.pool
+    stats = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            # QueuePool counts overflow from -size upwards
+            overflow=max(pool.overflow(), 0),
+        )
+    if isinstance(pool, _InstrumentedPoolMixin):
+        stats["wait"] = pool.wait_histogram.snapshot()
+    return stats
@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+import orjson
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.models.user import User, UserRole
+
+logger = logging.getLogger(__name__)
+
+# Everything handlers read from current_user; the password hash is never cached
+PRINCIPAL_COLUMNS = ("id", "email", "name", "role", "avatar_url", "google_id", "is_active", "created_at", "updated_at")
+
+def _snapshot(user: User) -> dict:
+    return {column: getattr(user, column) for column in PRINCIPAL_COLUMNS}
+
+def _to_user(snapshot: dict) -> User:
+    # A fresh detached instance per request, so no state is shared between requests
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+def _decode(raw: bytes) -> dict:
+    snapshot = orjson.loads(raw)
+    snapshot["id"] = UUID(snapshot["id"])
+    snapshot["role"] = UserRole(snapshot["role"])
+    for column in ("created_at", "updated_at"):
+        if snapshot[column] is not None:
+            snapshot[column] = datetime.fromisoformat(snapshot[column])
+    return snapshot
+
+class PrincipalCache:
+    """Authenticated users keyed by token subject, so get_current_user can skip the users query.
+
+    A bounded in-process LRU whose entries expire after ttl seconds, optionally backed by
+    Redis so workers share entries. With Redis, invalidations are also published on a
+    pub/sub channel and every worker drops its local entry. Local entries are only served
+    while that subscription is up; without it lookups go to Redis, and the local tier is
+    emptied when it comes back, since invalidations may have been missed.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        redis_url: Optional[str] = None,
+        channel: str = "principal:invalidations",
+        retry_after: float = 1.0,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._redis = aioredis.from_url(redis_url) if redis_url else None
+        self.channel = channel
+        self.retry_after = retry_after
+        self.subscribed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    async def start(self):
+        if self._redis is not None and self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def _listen(self):
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message["type"] == "subscribe":
+                            self._entries.clear()
+                            self.subscribed.set()
+                        elif message["type"] == "message":
+                            self._entries.pop(message["data"].decode(), None)
+            except (RedisError, OSError) as e:
+                logger.warning(f"Principal cache invalidation subscription lost: {str(e)}")
+            self.subscribed.clear()
+            await asyncio.sleep(self.retry_after)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.subscribed.clear()
+
+    def _local_trusted(self) -> bool:
+        # Without Redis there is nobody else to hear from; with it, only while subscribed
+        return self._redis is None or self.subscribed.is_set()
+
+    def _key(self, subject: str) -> str:
+        return f"principal:{subject}"
+
+    def _store(self, subject: str, snapshot: dict):
+        self._entries[subject] = (time.monotonic() + self.ttl, snapshot)
+        self._entries.move_to_end(subject)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get(self, subject: str) -> Optional[User]:
+        entry = self._entries.get(subject) if self._local_trusted() else None
+        if entry is not None:
+            expires_at, snapshot = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(subject)
+                self.hits += 1
+                return _to_user(snapshot)
+            del self._entries[subject]
+
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(self._key(subject))
+            except RedisError as e:
+                logger.warning(f"Principal cache Redis lookup failed: {str(e)}")
+                raw = None
+            if raw is not None:
+                snapshot = _decode(raw)
+                self._store(subject, snapshot)
+                self.redis_hits += 1
+                return _to_user(snapshot)
+
+        self.misses += 1
+        return None
+
+    async def set(self, subject: str, user: User):
+        snapshot = _snapshot(user)
+        self._store(subject, snapshot)
+        if self._redis is not None:
+            try:
+                await self._redis.set(self._key(subject), orjson.dumps(snapshot), ex=int(self.ttl))
+            except RedisError as e:
+                logger.warning(f"Principal cache Redis write failed: {str(e)}")
+
+    async def invalidate(self, subject: str):
+        self._entries.pop(subject, None)
+        if self._redis is not None:
+            try:
+                await self._redis.delete(self._key(subject))
+                await self._redis.publish(self.channel, subject)
+            except RedisError as e:
+                logger.warning(f"Principal cache Redis invalidation failed: {str(e)}")
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.redis_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "redis": self._redis is not None,
+            "subscribed": self.subscribed.is_set(),
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.redis_hits) / lookups, 4) if lookups else None,
+        }
+
+principal_cache = PrincipalCache(
+    settings.PRINCIPAL_CACHE_MAX_SIZE,
+    settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    settings.REDIS_URL if settings.PRINCIPAL_CACHE_REDIS else None,
+)
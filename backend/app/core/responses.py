@@ -0,0 +1,36 @@
+from functools import lru_cache
+from typing import Any, List, Type
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+# UUIDs, datetimes and enums are serialized natively; Z keeps UTC timestamps
+# identical to what pydantic emits
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+class ORJSONResponse(JSONResponse):
+    """Default response class. Handlers on the fast path hand it dicts from dump_model(s),
+    which orjson encodes without a jsonable_encoder pass."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+def json_dumps(content: Any) -> str:
+    return orjson.dumps(content, option=ORJSON_OPTIONS).decode()
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+def dump_model(schema: Type[BaseModel], obj) -> dict:
+    """Validate an ORM object against schema once and return the plain dict.
+
+    The same dict can be sent as the HTTP body and in WebSocket broadcasts.
+    """
+    return schema.model_validate(obj).model_dump()
+
+def dump_models(schema: Type[BaseModel], objects) -> List[dict]:
+    """dump_model for a sequence, validated and dumped in a single pydantic-core call each way"""
+    adapter = _list_adapter(schema)
+    return adapter.dump_python(adapter.validate_python(list(objects), from_attributes=True))
@@ -0,0 +1,66 @@
+import logging
+import time
+from typing import Optional
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class TokenRevocations:
+    """Minimum valid token version per user, for stateless access tokens.
+
+    Only users whose version was bumped are tracked, and only for as long as an access
+    token can live, so the set stays small. With Redis every worker sees every bump;
+    without it a bump is only known to the worker that made it.
+    """
+
+    def __init__(self, ttl: float, redis_url: Optional[str] = None):
+        self.ttl = ttl
+        self._redis = aioredis.from_url(redis_url) if redis_url else None
+        self._versions = {}
+
+    def _key(self, user_id: str) -> str:
+        return f"token_version:{user_id}"
+
+    async def revoke_before(self, user_id, version: int):
+        """Reject tokens for user_id issued with a version lower than version"""
+        user_id = str(user_id)
+        self._versions[user_id] = (time.monotonic() + self.ttl, version)
+        if self._redis is not None:
+            try:
+                await self._redis.set(self._key(user_id), version, ex=int(self.ttl))
+            except RedisError as e:
+                logger.warning(f"Token revocation Redis write failed: {str(e)}")
+
+    async def min_version(self, user_id) -> int:
+        user_id = str(user_id)
+        entry = self._versions.get(user_id)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._versions[user_id]
+            entry = None
+        version = entry[1] if entry else 0
+        if self._redis is not None:
+            try:
+                shared = await self._redis.get(self._key(user_id))
+            except RedisError as e:
+                logger.warning(f"Token revocation Redis lookup failed: {str(e)}")
+                shared = None
+            if shared is not None:
+                version = max(version, int(shared))
+        return version
+
+    async def is_revoked(self, user_id, version: int) -> bool:
+        return version < await self.min_version(user_id)
+
+    def clear(self):
+        self._versions.clear()
+
+# Stateless tokens are only as revocable as this store is shared: kept in Redis whenever
+# STATELESS_AUTH is on, so every worker sees each bump and it survives restarts
+token_revocations = TokenRevocations(
+    settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    settings.REDIS_URL if settings.STATELESS_AUTH else None,
+)
@@ -0,0 +1,63 @@
+import re
+from typing import List
+
+from sqlalchemy import Float, String, cast, false, func, literal_column, select, text, true
+from sqlalchemy.dialects.postgresql import ARRAY, array
+
+from app.models.issue import Issue
+
+def _fts5_query(q: str) -> str:
+    # Quote every word so user input can never be parsed as FTS5 query syntax
+    return " ".join(f'"{word}"' for word in re.findall(r"\w+", q))
+
+def search_issues(query, q: str, dialect: str, ranked: bool = True):
+    """Restrict an issue query to full-text matches for q, best match first unless ranked is False.
+
+    Postgres ranks the GIN-indexed search_vector with ts_rank; SQLite (tests, local dev)
+    falls back to the issues_fts FTS5 table and bm25.
+    """
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery(literal_column("'english'::regconfig"), q)
+        query = query.filter(Issue.search_vector.op("@@")(tsquery))
+        if not ranked:
+            return query
+        return query.order_by(func.ts_rank(Issue.search_vector, tsquery).desc(), Issue.created_at.desc())
+
+    match = _fts5_query(q)
+    if not match:
+        return query.filter(false())
+    matches = text(
+        "SELECT issues.id AS id, bm25(issues_fts) AS rank FROM issues_fts "
+        "JOIN issues ON issues.rowid = issues_fts.rowid WHERE issues_fts MATCH :match"
+    ).bindparams(match=match).columns(id=Issue.id.type, rank=Float).subquery()
+    query = query.join(matches, matches.c.id == Issue.id)
+    if not ranked:
+        return query
+    return query.order_by(matches.c.rank, Issue.created_at.desc())
+
+def filter_by_tags(query, tags: List[str], dialect: str, match_all: bool = False):
+    """Keep issues carrying any (or, with match_all, every) one of tags.
+
+    Postgres uses the array operators backed by the GIN index on issues.tags;
+    SQLite expands the JSON array with json_each.
+    """
+    tags = list(dict.fromkeys(tags))
+    if dialect == "postgresql":
+        wanted = cast(array(tags), ARRAY(String))
+        return query.filter(Issue.tags.op("@>" if match_all else "&&")(wanted))
+
+    tag_values = func.json_each(Issue.tags).table_valued("value")
+    matched = select(func.count(tag_values.c.value.distinct())).where(tag_values.c.value.in_(tags)).scalar_subquery()
+    return query.filter(matched == len(tags) if match_all else matched > 0)
+
+def tag_facets_query(dialect: str):
+    """One aggregate query yielding (tag, count) over issues; callers add filters"""
+    if dialect == "postgresql":
+        tag_values = func.unnest(Issue.tags).table_valued("tag").render_derived()
+        tag = tag_values.c.tag
+    else:
+        tag_values = func.json_each(Issue.tags).table_valued("value")
+        tag = tag_values.c.value
+    count = func.count(Issue.id)
+    query = select(tag.label("tag"), count.label("count")).select_from(Issue).join(tag_values, true())
+    return query.group_by(tag).order_by(count.desc(), tag)
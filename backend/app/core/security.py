@@ -1,5 +1,9 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
+from fastapi import HTTPException, status
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
@@ -12,6 +16,42 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+class PasswordHashPool:
+    """Runs bcrypt on a dedicated thread pool so a hash never blocks the event loop.
+
+    At most `workers` hashes run at once and `queue_size` more may wait; anything
+    beyond that is rejected with a 429 instead of piling up behind the pool.
+    """
+
+    def __init__(self, workers: int, queue_size: int):
+        self.capacity = workers + queue_size
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    async def run(self, func, *args):
+        with self._lock:
+            if self._pending >= self.capacity:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too many password checks in progress, retry shortly",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+password_hash_pool = PasswordHashPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_SIZE)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hash_pool.run(get_password_hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -22,6 +62,10 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+def access_token_claims(user) -> dict:
+    """Claims for an access token; uid, role and ver let STATELESS_AUTH skip the user lookup"""
+    return {"sub": user.email, "uid": str(user.id), "role": user.role.value, "ver": user.token_version or 0}
+
 def create_refresh_token(data: dict):
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
@@ -29,6 +73,12 @@ def create_refresh_token(data: dict):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+def decode_token(token: str) -> Optional[dict]:
+    try:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+
 def verify_token(token: str):
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
@@ -1,29 +1,218 @@
+import asyncio
+import logging
 from fastapi import WebSocket
-from typing import Dict, List
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from typing import Callable, Dict, List, Optional
+from app.core.responses import json_dumps
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Close code sent to clients dropped for not keeping up (1008: policy violation)
+SLOW_CONSUMER_CLOSE_CODE = 1008
+
+class ClientConnection:
+    """One socket with a bounded outgoing queue, drained by its own task.
+
+    Producers only enqueue, so a slow or dead client never holds up anyone else. A
+    message that cannot be queued, or a send that fails or exceeds send_timeout, drops
+    the connection through on_drop.
+    """
+
+    def __init__(self, websocket: WebSocket, queue_size: int, send_timeout: float, on_drop: Callable):
+        self.websocket = websocket
+        self.send_timeout = send_timeout
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._on_drop = on_drop
+        self._task = asyncio.create_task(self._drain())
+
+    def enqueue(self, message: str) -> bool:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _drain(self):
+        while True:
+            message = await self.queue.get()
+            try:
+                await asyncio.wait_for(self.websocket.send_text(message), self.send_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.info(f"Dropping WebSocket client after failed send: {e!r}")
+                self._on_drop(self)
+                return
+            finally:
+                self.queue.task_done()
+
+    def close(self, code: int = None):
+        """Stop draining and discard anything queued; with a code, also close the socket"""
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.queue.task_done()
+        if code is not None:
+            asyncio.create_task(self._close_socket(code))
+
+    async def _close_socket(self, code: int):
+        try:
+            await asyncio.wait_for(self.websocket.close(code=code), self.send_timeout)
+        except Exception:
+            pass
+
+class InProcessBackplane:
+    """Default backplane: a broadcast reaches the clients connected to this process only"""
+
+    def attach(self, deliver: Callable[[str], None]):
+        self._deliver = deliver
+
+    async def start(self):
+        pass
+
+    async def publish(self, message: str):
+        self._deliver(message)
+
+    async def stop(self):
+        pass
+
+class RedisBackplane:
+    """Relays broadcasts over a Redis pub/sub channel so clients on every worker get them.
+
+    Each worker holds one subscription and fans out whatever arrives on it to its own
+    clients, including the messages it published itself. While the subscription is down,
+    or if Redis rejects a publish, messages are still delivered to this worker's clients;
+    the subscription is retried every retry_after seconds.
+    """
+
+    def __init__(self, redis_url: str, channel: str, retry_after: float = 1.0):
+        self._redis = aioredis.from_url(redis_url)
+        self.channel = channel
+        self.retry_after = retry_after
+        self.subscribed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def attach(self, deliver: Callable[[str], None]):
+        self._deliver = deliver
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def _listen(self):
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message["type"] == "subscribe":
+                            self.subscribed.set()
+                        elif message["type"] == "message":
+                            self._deliver(message["data"].decode())
+            except (RedisError, OSError) as e:
+                logger.warning(f"WebSocket backplane subscription lost: {str(e)}")
+            self.subscribed.clear()
+            await asyncio.sleep(self.retry_after)
+
+    async def publish(self, message: str):
+        try:
+            await self._redis.publish(self.channel, message)
+        except RedisError as e:
+            logger.warning(f"WebSocket backplane publish failed: {str(e)}")
+            self._deliver(message)
+            return
+        if not self.subscribed.is_set():
+            self._deliver(message)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.subscribed.clear()
+        await self._redis.aclose()
+
+def create_backplane():
+    if settings.WEBSOCKET_BACKPLANE == "redis":
+        return RedisBackplane(settings.REDIS_URL, settings.WEBSOCKET_BACKPLANE_CHANNEL)
+    return InProcessBackplane()
 
 class WebSocketManager:
-    def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
+    def __init__(self, queue_size: int = None, send_timeout: float = None, backplane=None):
+        self.queue_size = queue_size or settings.WEBSOCKET_QUEUE_SIZE
+        self.send_timeout = send_timeout or settings.WEBSOCKET_SEND_TIMEOUT_SECONDS
+        self.active_connections: Dict[str, ClientConnection] = {}
+        self.dropped = 0
+        self.backplane = backplane or InProcessBackplane()
+        self.backplane.attach(self._fan_out)
+
+    async def start(self):
+        await self.backplane.start()
+
+    async def stop(self):
+        await self.backplane.stop()
 
     async def connect(self, websocket: WebSocket, client_id: str):
         await websocket.accept()
-        self.active_connections[client_id] = websocket
+        previous = self.active_connections.pop(client_id, None)
+        if previous is not None:
+            previous.close()
+        self.active_connections[client_id] = ClientConnection(
+            websocket, self.queue_size, self.send_timeout, lambda connection: self._drop(client_id, connection)
+        )
 
-    def disconnect(self, client_id: str):
-        if client_id in self.active_connections:
+    def disconnect(self, client_id: str, websocket: WebSocket = None):
+        """Forget client_id; with websocket, only if that socket is still the one registered"""
+        connection = self.active_connections.get(client_id)
+        if connection is None or (websocket is not None and connection.websocket is not websocket):
+            return
+        del self.active_connections[client_id]
+        connection.close()
+
+    def _drop(self, client_id: str, connection: ClientConnection):
+        # A reconnect may already have replaced this connection under the same id
+        if self.active_connections.get(client_id) is connection:
             del self.active_connections[client_id]
+        self.dropped += 1
+        connection.close(SLOW_CONSUMER_CLOSE_CODE)
 
     async def send_personal_message(self, message: str, client_id: str):
-        if client_id in self.active_connections:
-            await self.active_connections[client_id].send_text(message)
+        connection = self.active_connections.get(client_id)
+        if connection is not None and not connection.enqueue(message):
+            self._drop(client_id, connection)
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections.values():
-            await connection.send_text(message)
+        """Send message to every client of every worker sharing the backplane"""
+        await self.backplane.publish(message)
+
+    def _fan_out(self, message: str):
+        """Queue message for every client of this worker without waiting on any socket"""
+        overflowed: List[str] = [
+            client_id
+            for client_id, connection in self.active_connections.items()
+            if not connection.enqueue(message)
+        ]
+        for client_id in overflowed:
+            self._drop(client_id, self.active_connections[client_id])
 
     async def broadcast_issue_update(self, issue_data: dict):
         message = {
             "type": "issue_update",
             "data": issue_data
         }
-        await self.broadcast(str(message))
\ No newline at end of file
+        await self.broadcast(json_dumps(message))
+
+    async def flush(self):
+        """Wait until every message queued so far has been sent or discarded"""
+        await asyncio.gather(*(connection.queue.join() for connection in list(self.active_connections.values())))
+
+    def stats(self) -> dict:
+        return {
+            "connections": len(self.active_connections),
+            "queued": sum(connection.queue.qsize() for connection in self.active_connections.values()),
+            "queue_size": self.queue_size,
+            "dropped": self.dropped,
+            "backplane": type(self.backplane).__name__,
+        }
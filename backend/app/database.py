@@ -1,16 +1,112 @@
+import time
+from typing import List, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+
+# asyncio drivers used by the API for each backend in DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def async_database_url(url: str) -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name(), parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+def pool_options(url: str, poolclass) -> dict:
+    """Pool sizing from settings; SQLite keeps SQLAlchemy's default pool for its file/memory modes"""
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            poolclass=poolclass,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    return options
 
-engine = create_engine(settings.DATABASE_URL)
+# Synchronous engine for Celery workers, scripts and migrations
+engine = create_engine(settings.DATABASE_URL, **pool_options(settings.DATABASE_URL, InstrumentedQueuePool))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for request handlers, so queries don't block the event loop
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    **pool_options(settings.DATABASE_URL, InstrumentedAsyncQueuePool)
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+class ReplicaRouter:
+    """Hands out sessions on read replicas in round-robin order.
+
+    A replica that fails to connect is skipped for retry_after seconds; when none
+    is reachable the caller falls back to the primary.
+    """
+
+    def __init__(self, urls: List[str], retry_after: float = 30):
+        self.engines = [
+            create_async_engine(async_database_url(url), **pool_options(url, InstrumentedAsyncQueuePool))
+            for url in urls
+        ]
+        self.session_factories = [
+            async_sessionmaker(replica, autoflush=False, expire_on_commit=False) for replica in self.engines
+        ]
+        self.retry_after = retry_after
+        self._down_until = [0.0] * len(urls)
+        self._next = 0
+
+    def candidates(self):
+        """Healthy replica indexes, starting one further along on every call"""
+        now = time.monotonic()
+        count = len(self.engines)
+        start = self._next
+        self._next = (start + 1) % count
+        for offset in range(count):
+            index = (start + offset) % count
+            if self._down_until[index] <= now:
+                yield index
+
+    def mark_down(self, index: int):
+        self._down_until[index] = time.monotonic() + self.retry_after
+
+    async def session(self) -> Optional[AsyncSession]:
+        for index in self.candidates():
+            db = self.session_factories[index]()
+            try:
+                # Check out a connection now so a dead replica is caught before the handler runs
+                await db.connection()
+            except (DBAPIError, OSError):
+                await db.close()
+                self.mark_down(index)
+                continue
+            return db
+        return None
+
+REPLICA_URLS = [url.strip() for url in (settings.DATABASE_REPLICA_URLS or "").split(",") if url.strip()]
+replica_router = ReplicaRouter(REPLICA_URLS, settings.DB_REPLICA_RETRY_SECONDS) if REPLICA_URLS else None
+
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_read_db():
+    """Session for read-only handlers: a healthy replica if configured, otherwise the primary.
+
+    Replicas may lag, so anything that writes or must see its own writes uses get_db.
+    """
+    db = await replica_router.session() if replica_router else None
+    if db is None:
+        db = AsyncSessionLocal()
+    async with db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
@@ -1,9 +1,15 @@
+from dataclasses import dataclass
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
-from app.core.security import verify_token
-from app.models.user import User
+from app.core.config import settings
+from app.core.security import verify_token, decode_token
+from app.core.principal_cache import principal_cache
+from app.core.revocation import token_revocations
+from app.models.user import User, UserRole
 from fastapi import Request
 
 class HTTPBearer401(HTTPBearer):
@@ -22,7 +28,7 @@ security = HTTPBearer401()
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     token = credentials.credentials
     email = verify_token(token)
@@ -33,12 +39,16 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = db.query(User).filter(User.email == email).first()
+    # User rows rarely change, so most requests are served from the cache
+    user = await principal_cache.get(email)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
+        user = await db.scalar(select(User).where(User.email == email))
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        await principal_cache.set(email, user)
     
     if not user.is_active:
         raise HTTPException(
@@ -51,4 +61,35 @@ async def get_current_user(
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
\ No newline at end of file
+    return current_user
+
+@dataclass(frozen=True)
+class Principal:
+    """The id, email and role read-only handlers need, taken straight from token claims"""
+    id: UUID
+    email: str
+    role: UserRole
+    is_active: bool = True
+
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+):
+    """Authorize from claims when STATELESS_AUTH is on, otherwise load the user as usual.
+
+    The session is only used on the fallback path (tokens without claims), so the
+    stateless path never checks out a connection. A deactivation or role change bumps
+    the user's token version, which revokes tokens issued before it.
+    """
+    if settings.STATELESS_AUTH:
+        claims = decode_token(credentials.credentials)
+        if claims and {"sub", "uid", "role", "ver"} <= claims.keys():
+            if await token_revocations.is_revoked(claims["uid"], claims["ver"]):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Token has been revoked",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            return Principal(id=UUID(claims["uid"]), email=claims["sub"], role=UserRole(claims["role"]))
+    
+    return await get_current_active_user(await get_current_user(credentials, db))
\ No newline at end of file
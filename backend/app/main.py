@@ -4,11 +4,13 @@ from fastapi.staticfiles import StaticFiles
 import uvicorn
 import os
 
-from app.api.v1 import auth, users, issues, files, stats, notifications
-from app.core.websocket import WebSocketManager
+from app.api.v1 import auth, users, issues, files, stats, notifications, admin
+from app.core.websocket import WebSocketManager, create_backplane
+from app.core.principal_cache import principal_cache
 from app.database import engine
 from app.models import Base
 from app.core.config import settings
+from app.core.responses import ORJSONResponse
 
 
 
@@ -17,7 +19,8 @@ app = FastAPI(
     description="A comprehensive issue tracking and insights platform",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -29,8 +32,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# WebSocket manager
-websocket_manager = WebSocketManager()
+# WebSocket manager; the backplane carries broadcasts to the other workers' clients
+websocket_manager = WebSocketManager(backplane=create_backplane())
+
+@app.on_event("startup")
+async def start_websocket_backplane():
+    await websocket_manager.start()
+
+@app.on_event("shutdown")
+async def stop_websocket_backplane():
+    await websocket_manager.stop()
+
+@app.on_event("startup")
+async def start_principal_cache_invalidations():
+    await principal_cache.start()
+
+@app.on_event("shutdown")
+async def stop_principal_cache_invalidations():
+    await principal_cache.stop()
 
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["authentication"])
@@ -39,6 +58,7 @@ app.include_router(issues.router, prefix="/api/v1/issues", tags=["issues"])
 app.include_router(files.router, prefix="/api/v1/files", tags=["files"])
 app.include_router(stats.router, prefix="/api/v1/stats", tags=["statistics"])
 app.include_router(notifications.router, prefix="/api/v1/notifications", tags=["notifications"])
+app.include_router(admin.router, prefix="/api/v1/admin", tags=["admin"])
 
 # Static files for uploads
 os.makedirs("uploads", exist_ok=True)
@@ -52,7 +72,7 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
             data = await websocket.receive_text()
             await websocket_manager.send_personal_message(f"Message received: {data}", client_id)
     except WebSocketDisconnect:
-        websocket_manager.disconnect(client_id)
+        websocket_manager.disconnect(client_id, websocket)
 
 @app.get("/")
 async def root():
@@ -3,5 +3,9 @@ from .user import User
 from .issue import Issue
 from .file import IssueFile
 from .daily_stats import DailyStats
+from .issue_counter import IssueCounter
+from .stats_rollup import StatsRollup
+from .issue_event import IssueEvent
+from .lead_time import LeadTimeBucket, EventCursor
 
-__all__ = ["Base", "User", "Issue", "IssueFile", "DailyStats"]
\ No newline at end of file
+__all__ = ["Base", "User", "Issue", "IssueFile", "DailyStats", "IssueCounter", "StatsRollup", "IssueEvent", "LeadTimeBucket", "EventCursor"]
\ No newline at end of file
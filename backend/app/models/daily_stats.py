@@ -20,5 +20,7 @@ class DailyStats(Base):
     medium_count = Column(Integer, nullable=False, default=0)
     low_count = Column(Integer, nullable=False, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Set by every aggregation run; caches derived from a run are keyed on it
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     __table_args__ = (UniqueConstraint('date', name='_daily_stats_date_uc'),)
\ No newline at end of file
@@ -1,8 +1,9 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum, ARRAY
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum, ARRAY, Index, DDL, event
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from sqlalchemy.types import JSON, TypeDecorator
+from datetime import datetime, timezone
 import uuid
 import enum
 import os
@@ -41,6 +42,17 @@ class TagsType(TypeDecorator):
             return []
         return value
 
+class SearchVectorType(TypeDecorator):
+    """tsvector on Postgres; other dialects get an unused Text column and search through FTS5"""
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(TSVECTOR())
+        else:
+            return dialect.type_descriptor(Text())
+
 class Issue(Base):
     __tablename__ = "issues"
 
@@ -52,10 +64,70 @@ class Issue(Base):
     reporter_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     assignee_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
     tags = Column(TagsType, default=list)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Set in Python so every row is stored with the same precision as keyset cursor bounds;
+    # SQLite's CURRENT_TIMESTAMP drops microseconds and sorts before an equal cursor value
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Maintained by a database trigger, never loaded into the ORM object
+    search_vector = deferred(Column(SearchVectorType))
 
     # Relationships
     reporter = relationship("User", foreign_keys=[reporter_id], back_populates="reported_issues")
     assignee = relationship("User", foreign_keys=[assignee_id], back_populates="assigned_issues")
-    files = relationship("IssueFile", back_populates="issue", cascade="all, delete-orphan")
\ No newline at end of file
+    files = relationship("IssueFile", back_populates="issue", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Keyset pagination: newest-first scans for everyone, and per reporter for REPORTER users
+        Index("ix_issues_created_at_id", "created_at", "id"),
+        Index("ix_issues_reporter_id_created_at_id", "reporter_id", "created_at", "id"),
+        # Per-reporter GROUP BY status, severity (counter reconciliation) as an index-only scan
+        Index("ix_issues_reporter_id_status_severity", "reporter_id", "status", "severity"),
+        Index("ix_issues_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_issues_tags", "tags", postgresql_using="gin"),
+    )
+
+# Full-text search DDL for tables built with metadata.create_all (dev and tests);
+# Postgres deployments get the same trigger from the Alembic migration.
+POSTGRES_SEARCH_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION issues_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER issues_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON issues
+    FOR EACH ROW EXECUTE FUNCTION issues_search_vector_update()
+    """,
+]
+
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE issues_fts USING fts5(title, description, content='issues', content_rowid='rowid')",
+    """
+    CREATE TRIGGER issues_fts_ai AFTER INSERT ON issues BEGIN
+        INSERT INTO issues_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER issues_fts_ad AFTER DELETE ON issues BEGIN
+        INSERT INTO issues_fts(issues_fts, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER issues_fts_au AFTER UPDATE OF title, description ON issues BEGIN
+        INSERT INTO issues_fts(issues_fts, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO issues_fts(rowid, title, description) VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+]
+
+for statement in POSTGRES_SEARCH_DDL:
+    event.listen(Issue.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(Issue.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(Issue.__table__, "after_drop", DDL("DROP TABLE IF EXISTS issues_fts").execute_if(dialect="sqlite"))
\ No newline at end of file
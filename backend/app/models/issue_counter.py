@@ -0,0 +1,77 @@
+from collections import Counter
+from sqlalchemy import Column, Integer, ForeignKey, Enum, PrimaryKeyConstraint, event, inspect
+from sqlalchemy.dialects.postgresql import UUID, insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.issue import Issue, IssueStatus, IssueSeverity
+
+# Columns of issues that identify a counter row
+COUNTER_KEY = ("reporter_id", "status", "severity")
+
+class IssueCounter(Base):
+    """Number of issues per (reporter, status, severity), kept in step with issues on every flush.
+
+    Dashboards read these few rows instead of scanning issues; the global view sums over
+    reporters, which keeps concurrent writers from contending on a handful of hot rows.
+    """
+    __tablename__ = "issue_counters"
+
+    reporter_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    status = Column(Enum(IssueStatus), nullable=False)
+    severity = Column(Enum(IssueSeverity), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (PrimaryKeyConstraint("reporter_id", "status", "severity"),)
+
+def upsert_counters(connection, counts: dict, increment: bool = True):
+    """Add (or, with increment=False, assign) counts keyed by (reporter_id, status, severity).
+
+    Rows are written in key order so concurrent transactions lock them in the same order.
+    """
+    rows = [
+        {"reporter_id": reporter_id, "status": status, "severity": severity, "count": count}
+        for (reporter_id, status, severity), count in sorted(counts.items(), key=lambda item: str(item[0]))
+        if count or not increment
+    ]
+    if not rows:
+        return
+    insert = postgresql_insert if connection.dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(IssueCounter).values(rows)
+    new_count = IssueCounter.count + stmt.excluded.count if increment else stmt.excluded.count
+    connection.execute(stmt.on_conflict_do_update(index_elements=list(COUNTER_KEY), set_={"count": new_count}))
+
+def _current_key(issue: Issue) -> tuple:
+    return tuple(getattr(issue, name) for name in COUNTER_KEY)
+
+def _committed_key(issue: Issue) -> tuple:
+    attrs = inspect(issue).attrs
+    key = []
+    for name in COUNTER_KEY:
+        history = attrs[name].history
+        key.append(history.deleted[0] if history.deleted else getattr(issue, name))
+    return tuple(key)
+
+@event.listens_for(Session, "after_flush")
+def track_issue_counters(session, flush_context):
+    """Apply this flush's inserts, deletes and status/severity changes to issue_counters.
+
+    Runs inside the flush's transaction, so counters commit or roll back with the issues.
+    Core INSERTs that bypass the unit of work (bulk create) call upsert_counters themselves.
+    """
+    deltas = Counter()
+    for obj in session.new:
+        if isinstance(obj, Issue):
+            deltas[_current_key(obj)] += 1
+    for obj in session.deleted:
+        if isinstance(obj, Issue):
+            deltas[_committed_key(obj)] -= 1
+    for obj in session.dirty:
+        if isinstance(obj, Issue) and obj not in session.deleted:
+            old_key, new_key = _committed_key(obj), _current_key(obj)
+            if old_key != new_key:
+                deltas[old_key] -= 1
+                deltas[new_key] += 1
+    if any(deltas.values()):
+        upsert_counters(session.connection(), deltas)
@@ -0,0 +1,79 @@
+import enum
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, ForeignKey, Index, event, inspect, insert
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.database import Base
+from app.models.issue import Issue
+
+# Issue attributes whose transitions are recorded
+TRACKED_FIELDS = ("status", "severity", "assignee_id")
+
+class IssueEvent(Base):
+    """Append-only log of status, severity and assignee transitions.
+
+    Rows are written by the flush that changes the issue, so they commit or roll back with
+    it. Creation is logged as a transition from NULL. The id is increasing, which lets
+    consumers such as the lead-time task resume from the last id they processed.
+    """
+    __tablename__ = "issue_events"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    issue_id = Column(UUID(as_uuid=True), ForeignKey("issues.id", ondelete="CASCADE"), nullable=False)
+    field = Column(String(20), nullable=False)
+    old_value = Column(String(64))
+    new_value = Column(String(64))
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (Index("ix_issue_events_issue_id_created_at", "issue_id", "created_at"),)
+
+def _event_value(value):
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        return value.value
+    return str(value)
+
+def creation_events(issue_id, values: dict) -> list:
+    """Events logging a new issue's tracked fields, from the values it was inserted with"""
+    return [
+        {"issue_id": issue_id, "field": field, "old_value": None, "new_value": _event_value(values.get(field))}
+        for field in TRACKED_FIELDS
+        if values.get(field) is not None
+    ]
+
+def record_issue_events(connection, events: list):
+    if events:
+        connection.execute(insert(IssueEvent), events)
+
+def _keep_old_value(target, value, oldvalue, initiator):
+    pass
+
+# Load the previous value when a tracked field is set on an expired issue, so the
+# transition is logged from it rather than from NULL (which reads as creation)
+for _field in TRACKED_FIELDS:
+    event.listen(getattr(Issue, _field), "set", _keep_old_value, active_history=True)
+
+@event.listens_for(Session, "after_flush")
+def track_issue_events(session, flush_context):
+    """Log this flush's new issues and tracked-field changes to issue_events.
+
+    Core INSERTs that bypass the unit of work (bulk create) call record_issue_events themselves.
+    """
+    events = []
+    for obj in session.new:
+        if isinstance(obj, Issue):
+            events.extend(creation_events(obj.id, {field: getattr(obj, field) for field in TRACKED_FIELDS}))
+    for obj in session.dirty:
+        if isinstance(obj, Issue) and obj not in session.deleted:
+            attrs = inspect(obj).attrs
+            for field in TRACKED_FIELDS:
+                history = attrs[field].history
+                if not history.has_changes():
+                    continue
+                old = _event_value(history.deleted[0]) if history.deleted else None
+                new = _event_value(getattr(obj, field))
+                if old != new:
+                    events.append({"issue_id": obj.id, "field": field, "old_value": old, "new_value": new})
+    record_issue_events(session.connection(), events)
@@ -0,0 +1,68 @@
+import math
+from sqlalchemy import Column, BigInteger, Integer, String, Enum, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.database import Base
+from app.models.issue import IssueSeverity
+
+# Histogram buckets grow geometrically from one minute, so a bucket's midpoint is within
+# about 12% of any duration in it; bucket 80 already starts past five years.
+LEAD_TIME_BASE_SECONDS = 60
+LEAD_TIME_GROWTH = 1.25
+LEAD_TIME_MAX_BUCKET = 80
+
+class LeadTimeBucket(Base):
+    """Histogram of time from creation to DONE, per severity, fed from issue_events"""
+    __tablename__ = "lead_time_buckets"
+
+    severity = Column(Enum(IssueSeverity), nullable=False)
+    bucket = Column(Integer, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (PrimaryKeyConstraint("severity", "bucket"),)
+
+class EventCursor(Base):
+    """Last issue_events id a consumer has processed"""
+    __tablename__ = "event_cursors"
+
+    name = Column(String(50), primary_key=True)
+    position = Column(BigInteger, nullable=False, default=0)
+
+def lead_time_bucket(seconds: float) -> int:
+    if seconds < LEAD_TIME_BASE_SECONDS:
+        return 0
+    bucket = int(math.log(seconds / LEAD_TIME_BASE_SECONDS, LEAD_TIME_GROWTH))
+    return min(bucket, LEAD_TIME_MAX_BUCKET)
+
+def bucket_midpoint(bucket: int) -> float:
+    """Representative duration in seconds for a bucket (its geometric midpoint)"""
+    return LEAD_TIME_BASE_SECONDS * LEAD_TIME_GROWTH ** (bucket + 0.5)
+
+def histogram_quantile(counts: dict, q: float):
+    """Approximate q-quantile in seconds from {bucket: count}, or None when empty"""
+    total = sum(counts.values())
+    if not total:
+        return None
+    rank = q * total
+    seen = 0
+    for bucket in sorted(counts):
+        seen += counts[bucket]
+        if seen >= rank:
+            return bucket_midpoint(bucket)
+
+def upsert_lead_time_buckets(connection, counts: dict):
+    """Add counts keyed by (severity, bucket)"""
+    rows = [
+        {"severity": severity, "bucket": bucket, "count": count}
+        for (severity, bucket), count in sorted(counts.items(), key=lambda item: (item[0][0].value, item[0][1]))
+    ]
+    if not rows:
+        return
+    insert = postgresql_insert if connection.dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(LeadTimeBucket).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["severity", "bucket"],
+        set_={"count": LeadTimeBucket.count + stmt.excluded.count}
+    )
+    connection.execute(stmt)
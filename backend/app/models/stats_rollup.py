@@ -0,0 +1,56 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from datetime import date, timedelta
+import uuid
+
+from app.database import Base
+
+# Rollup periods precomputed from daily_stats; "day" is served from daily_stats itself
+ROLLUP_PERIODS = ("week", "month")
+
+# Count columns shared by daily_stats and stats_rollups
+SNAPSHOT_COLUMNS = (
+    "total_issues", "open_issues", "triaged_issues", "in_progress_issues", "done_issues",
+    "critical_count", "high_count", "medium_count", "low_count",
+)
+
+def period_start(day: date, period: str) -> date:
+    """First day of the ISO week (Monday) or calendar month containing day"""
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    return day
+
+def next_period_start(start: date, period: str) -> date:
+    if period == "week":
+        return start + timedelta(days=7)
+    if period == "month":
+        return (start.replace(day=1) + timedelta(days=32)).replace(day=1)
+    return start + timedelta(days=1)
+
+class StatsRollup(Base):
+    """End-of-period snapshot of daily_stats for each week and month.
+
+    daily_stats rows are point-in-time counts, so a period takes the values of its latest
+    day rather than a sum; `date` records which day that was.
+    """
+    __tablename__ = "stats_rollups"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    period = Column(String(10), nullable=False)
+    period_start = Column(Date, nullable=False)
+    date = Column(Date, nullable=False)
+    total_issues = Column(Integer, nullable=False, default=0)
+    open_issues = Column(Integer, nullable=False, default=0)
+    triaged_issues = Column(Integer, nullable=False, default=0)
+    in_progress_issues = Column(Integer, nullable=False, default=0)
+    done_issues = Column(Integer, nullable=False, default=0)
+    critical_count = Column(Integer, nullable=False, default=0)
+    high_count = Column(Integer, nullable=False, default=0)
+    medium_count = Column(Integer, nullable=False, default=0)
+    low_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (UniqueConstraint('period', 'period_start', name='_stats_rollups_period_start_uc'),)
@@ -1,12 +1,20 @@
 from .user import UserCreate, UserResponse, UserUpdate
-from .issue import IssueCreate, IssueResponse, IssueUpdate
+from .issue import (
+    IssueCreate, IssueResponse, IssueUpdate, IssuePage, TagFacet,
+    IssueBulkCreate, IssueBulkUpdate, IssueBulkUpdateItem, BulkItemError, IssueBulkResponse
+)
 from .auth import Token, TokenData, LoginRequest
 from .file import FileResponse
-from .stats import DashboardStats
+from .stats import (
+    DashboardStats, StatsPoint, StatsTimeSeries, LeadTime, LeadTimeStats,
+    TagPair, TagCooccurrence, TagTrend, TagTrends
+)
 
 __all__ = [
     "UserCreate", "UserResponse", "UserUpdate",
-    "IssueCreate", "IssueResponse", "IssueUpdate",
+    "IssueCreate", "IssueResponse", "IssueUpdate", "IssuePage", "TagFacet",
+    "IssueBulkCreate", "IssueBulkUpdate", "IssueBulkUpdateItem", "BulkItemError", "IssueBulkResponse",
     "Token", "TokenData", "LoginRequest",
-    "FileResponse", "DashboardStats"
+    "FileResponse", "DashboardStats", "StatsPoint", "StatsTimeSeries", "LeadTime", "LeadTimeStats",
+    "TagPair", "TagCooccurrence", "TagTrend", "TagTrends"
 ]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -20,7 +20,7 @@ class IssueUpdate(BaseModel):
     description: Optional[str] = None
     severity: Optional[IssueSeverity] = None
     status: Optional[IssueStatus] = None
-    assignee_id: Optional[str] = None
+    assignee_id: Optional[UUID] = None
     tags: Optional[List[str]] = None
 
 class IssueResponse(IssueBase):
@@ -35,4 +35,35 @@ class IssueResponse(IssueBase):
     files: List[FileResponse] = []
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class IssuePage(BaseModel):
+    items: List[IssueResponse]
+    next_cursor: Optional[str] = None
+
+
+class TagFacet(BaseModel):
+    tag: str
+    count: int
+
+
+BULK_MAX_ITEMS = 500
+
+class IssueBulkCreate(BaseModel):
+    items: List[IssueCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class IssueBulkUpdateItem(IssueUpdate):
+    id: UUID
+
+class IssueBulkUpdate(BaseModel):
+    items: List[IssueBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class BulkItemError(BaseModel):
+    index: int
+    id: Optional[UUID] = None
+    detail: str
+
+class IssueBulkResponse(BaseModel):
+    issues: List[IssueResponse]
+    errors: List[BulkItemError] = []
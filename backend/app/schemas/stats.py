@@ -1,5 +1,6 @@
 from pydantic import BaseModel
-from typing import Dict
+from typing import Dict, List, Optional
+from datetime import date
 
 class DashboardStats(BaseModel):
     total_issues: int
@@ -7,4 +8,55 @@ class DashboardStats(BaseModel):
     in_progress_issues: int
     closed_issues: int
     issues_by_severity: Dict[str, int]
-    issues_by_status: Dict[str, int]
\ No newline at end of file
+    issues_by_status: Dict[str, int]
+
+class StatsPoint(BaseModel):
+    period_start: date
+    # Day whose snapshot the point carries: the last aggregated day of the week or month
+    date: date
+    total_issues: int
+    open_issues: int
+    triaged_issues: int
+    in_progress_issues: int
+    done_issues: int
+    critical_count: int
+    high_count: int
+    medium_count: int
+    low_count: int
+
+class StatsTimeSeries(BaseModel):
+    bucket: str
+    points: List[StatsPoint]
+
+class LeadTime(BaseModel):
+    resolved: int
+    median_hours: Optional[float]
+    p90_hours: Optional[float]
+
+class LeadTimeStats(BaseModel):
+    # Keyed by severity; durations run from creation to each transition into DONE
+    by_severity: Dict[str, LeadTime]
+
+class TagPair(BaseModel):
+    tags: List[str]
+    count: int
+
+class TagCooccurrence(BaseModel):
+    tags: List[str]
+    # counts[i][j]: issues tagged with both tags[i] and tags[j]; the diagonal is each tag's total
+    counts: List[List[int]]
+    pairs: List[TagPair]
+
+class TagTrend(BaseModel):
+    tag: str
+    counts: List[int]
+    rolling_mean: List[float]
+    # Last week against the week before
+    change: int
+    growth: float
+
+class TagTrends(BaseModel):
+    # Monday of each week in counts, oldest first, ending with the last complete week
+    weeks: List[date]
+    window: int
+    tags: List[TagTrend]
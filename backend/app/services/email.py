@@ -131,6 +131,46 @@ class EmailService:
         
         return self.send_email(to_emails, subject, body, html_body)
     
+    def send_issue_digest(
+        self,
+        to_emails: List[str],
+        issues: List[dict],
+        action: str = "created"
+    ) -> bool:
+        """Send one email summarising several issues"""
+        subject = f"{len(issues)} Issues {action.title()}"
+        
+        issue_lines = "\n".join(
+            f"        - [{issue['status']}] {issue['title']}: http://localhost:3000/issues/{issue['id']}"
+            for issue in issues
+        )
+        body = f"""
+        The following issues have been {action}:
+        
+{issue_lines}
+        
+        Best regards,
+        Issues & Insights Tracker Team
+        """
+        
+        issue_items = "".join(
+            f'<li><a href="http://localhost:3000/issues/{issue["id"]}">{issue["title"]}</a> ({issue["status"]})</li>'
+            for issue in issues
+        )
+        html_body = f"""
+        <html>
+        <body>
+            <h2>Issues {action.title()}</h2>
+            <p>The following issues have been <strong>{action}</strong>:</p>
+            <ul>{issue_items}</ul>
+            
+            <p>Best regards,<br>Issues & Insights Tracker Team</p>
+        </body>
+        </html>
+        """
+        
+        return self.send_email(to_emails, subject, body, html_body)
+    
     def send_password_reset(
         self,
         to_email: str,
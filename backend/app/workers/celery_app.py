@@ -22,5 +22,13 @@ celery_app.conf.update(
             "task": "app.workers.tasks.aggregate_daily_stats",
             "schedule": 30.0 * 60,  # Every 30 minutes
         },
+        "reconcile-issue-counters": {
+            "task": "app.workers.tasks.reconcile_issue_counters",
+            "schedule": 6.0 * 60 * 60,  # Every 6 hours
+        },
+        "update-lead-times": {
+            "task": "app.workers.tasks.update_lead_times",
+            "schedule": 5.0 * 60,  # Every 5 minutes
+        },
     },
 )
\ No newline at end of file
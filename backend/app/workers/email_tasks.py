@@ -1,5 +1,5 @@
 from celery import Celery
-from typing import List
+from typing import Dict, List
 from app.workers.celery_app import celery_app
 from app.services.email import email_service
 
@@ -16,6 +16,18 @@ def send_issue_notification_task(
         to_emails, issue_title, issue_description, issue_id, action
     )
 
+@celery_app.task
+def send_issue_digest_task(
+    recipients: Dict[str, List[dict]],
+    action: str = "created"
+):
+    """Background task to send each recipient one email covering a batch of issues"""
+    results = [
+        email_service.send_issue_digest([to_email], issues, action)
+        for to_email, issues in recipients.items()
+    ]
+    return all(results)
+
 @celery_app.task
 def send_password_reset_task(
     to_email: str,
@@ -1,11 +1,73 @@
 from celery import Celery
+from sqlalchemy import case, func, select, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from datetime import date, datetime
+from collections import Counter
 from app.database import SessionLocal
 from app.models.issue import Issue, IssueStatus, IssueSeverity
 from app.models.daily_stats import DailyStats
+from app.models.issue_counter import IssueCounter, upsert_counters
+from app.models.issue_event import IssueEvent
+from app.models.lead_time import EventCursor, lead_time_bucket, upsert_lead_time_buckets
+from app.models.stats_rollup import StatsRollup, ROLLUP_PERIODS, SNAPSHOT_COLUMNS, period_start, next_period_start
 from app.workers.celery_app import celery_app
 
+def update_stats_rollups(db: Session, day: date, periods=ROLLUP_PERIODS):
+    """Refresh the week and month rollups containing day from their latest daily_stats row"""
+    for period in periods:
+        start = period_start(day, period)
+        latest = db.query(DailyStats).filter(
+            DailyStats.date >= start,
+            DailyStats.date < next_period_start(start, period)
+        ).order_by(DailyStats.date.desc()).first()
+        if latest is None:
+            continue
+        
+        rollup = db.query(StatsRollup).filter(
+            StatsRollup.period == period,
+            StatsRollup.period_start == start
+        ).first()
+        if rollup is None:
+            rollup = StatsRollup(period=period, period_start=start)
+            db.add(rollup)
+        rollup.date = latest.date
+        for column in SNAPSHOT_COLUMNS:
+            setattr(rollup, column, getattr(latest, column))
+
+# Key for the transaction-scoped advisory lock held while aggregating (Postgres only)
+AGGREGATE_LOCK_KEY = 4120001
+
+def daily_stats_counts():
+    """One SELECT folding issue_counters into every daily_stats count column via conditional sums"""
+    def total(condition=None):
+        value = IssueCounter.count if condition is None else case((condition, IssueCounter.count), else_=0)
+        return func.coalesce(func.sum(value), 0)
+    
+    return select(
+        total().label("total_issues"),
+        total(IssueCounter.status == IssueStatus.OPEN).label("open_issues"),
+        total(IssueCounter.status == IssueStatus.TRIAGED).label("triaged_issues"),
+        total(IssueCounter.status == IssueStatus.IN_PROGRESS).label("in_progress_issues"),
+        total(IssueCounter.status == IssueStatus.DONE).label("done_issues"),
+        total(IssueCounter.severity == IssueSeverity.CRITICAL).label("critical_count"),
+        total(IssueCounter.severity == IssueSeverity.HIGH).label("high_count"),
+        total(IssueCounter.severity == IssueSeverity.MEDIUM).label("medium_count"),
+        total(IssueCounter.severity == IssueSeverity.LOW).label("low_count"),
+    )
+
+def upsert_daily_stats(db: Session, day: date, counts: dict):
+    """Insert or overwrite the daily_stats row for day in a single statement"""
+    changes = {**counts, "updated_at": func.now()}
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = postgresql_insert(DailyStats).values(date=day, **counts)
+        stmt = stmt.on_conflict_do_update(constraint="_daily_stats_date_uc", set_=changes)
+    else:
+        stmt = sqlite_insert(DailyStats).values(date=day, **counts)
+        stmt = stmt.on_conflict_do_update(index_elements=["date"], set_=changes)
+    db.execute(stmt)
+
 @celery_app.task
 def aggregate_daily_stats():
     """Aggregate daily statistics for issues"""
@@ -13,54 +75,138 @@ def aggregate_daily_stats():
     try:
         today = date.today()
         
-        # Check if stats already exist for today
-        existing_stats = db.query(DailyStats).filter(DailyStats.date == today).first()
+        if db.get_bind().dialect.name == "postgresql":
+            # An overlapping run already holds the lock and will write the same numbers
+            locked = db.execute(select(func.pg_try_advisory_xact_lock(AGGREGATE_LOCK_KEY))).scalar()
+            if not locked:
+                db.rollback()
+                return f"Daily stats aggregation for {today} already running"
+        
+        counts = dict(db.execute(daily_stats_counts()).one()._mapping)
+        upsert_daily_stats(db, today, counts)
+        update_stats_rollups(db, today)
+        
+        db.commit()
+        return f"Daily stats aggregated for {today}"
+        
+    except Exception as e:
+        db.rollback()
+        raise e
+    finally:
+        db.close()
+
+@celery_app.task
+def reconcile_issue_counters():
+    """Recount issues and repair any issue_counters rows that drifted, one reporter at a time"""
+    db: Session = SessionLocal()
+    try:
+        reporter_ids = set(db.scalars(select(Issue.reporter_id).distinct())) | set(
+            db.scalars(select(IssueCounter.reporter_id).distinct())
+        )
+        db.commit()
+        
+        repaired = 0
+        for reporter_id in sorted(reporter_ids, key=str):
+            # Locking only this reporter's counters holds back just their writers, which then
+            # apply their deltas on top of the recount (it cannot see their uncommitted issues)
+            stored = {
+                (counter.reporter_id, counter.status, counter.severity): counter.count
+                for counter in db.execute(
+                    select(IssueCounter)
+                    .where(IssueCounter.reporter_id == reporter_id)
+                    .order_by(IssueCounter.status, IssueCounter.severity)
+                    .with_for_update()
+                ).scalars().all()
+            }
+            actual = {
+                (reporter_id, status, severity): count
+                for status, severity, count in db.execute(
+                    select(Issue.status, Issue.severity, func.count(Issue.id))
+                    .where(Issue.reporter_id == reporter_id)
+                    .group_by(Issue.status, Issue.severity)
+                ).all()
+            }
+            drifted = {
+                key: actual.get(key, 0)
+                for key in actual.keys() | stored.keys()
+                if actual.get(key, 0) != stored.get(key, 0)
+            }
+            upsert_counters(db.connection(), drifted, increment=False)
+            db.commit()
+            repaired += len(drifted)
+        
+        return f"Reconciled {repaired} issue counters"
         
-        # Count issues by status
-        total_issues = db.query(Issue).count()
-        open_issues = db.query(Issue).filter(Issue.status == IssueStatus.OPEN).count()
-        triaged_issues = db.query(Issue).filter(Issue.status == IssueStatus.TRIAGED).count()
-        in_progress_issues = db.query(Issue).filter(Issue.status == IssueStatus.IN_PROGRESS).count()
-        done_issues = db.query(Issue).filter(Issue.status == IssueStatus.DONE).count()
+    except Exception as e:
+        db.rollback()
+        raise e
+    finally:
+        db.close()
+
+@celery_app.task
+def rebuild_stats_rollups():
+    """Recompute every week and month rollup from daily_stats, e.g. after a backfill"""
+    db: Session = SessionLocal()
+    try:
+        days = [day for (day,) in db.query(DailyStats.date).all()]
+        periods = {(period, period_start(day, period)) for day in days for period in ROLLUP_PERIODS}
+        for period, start in sorted(periods):
+            update_stats_rollups(db, start, periods=(period,))
         
-        # Count issues by severity
-        critical_count = db.query(Issue).filter(Issue.severity == IssueSeverity.CRITICAL).count()
-        high_count = db.query(Issue).filter(Issue.severity == IssueSeverity.HIGH).count()
-        medium_count = db.query(Issue).filter(Issue.severity == IssueSeverity.MEDIUM).count()
-        low_count = db.query(Issue).filter(Issue.severity == IssueSeverity.LOW).count()
+        db.commit()
+        return f"Rebuilt {len(periods)} stats rollups"
         
-        if existing_stats:
-            # Update existing stats
-            existing_stats.total_issues = total_issues
-            existing_stats.open_issues = open_issues
-            existing_stats.triaged_issues = triaged_issues
-            existing_stats.in_progress_issues = in_progress_issues
-            existing_stats.done_issues = done_issues
-            existing_stats.critical_count = critical_count
-            existing_stats.high_count = high_count
-            existing_stats.medium_count = medium_count
-            existing_stats.low_count = low_count
-        else:
-            # Create new stats
-            stats = DailyStats(
-                date=today,
-                total_issues=total_issues,
-                open_issues=open_issues,
-                triaged_issues=triaged_issues,
-                in_progress_issues=in_progress_issues,
-                done_issues=done_issues,
-                critical_count=critical_count,
-                high_count=high_count,
-                medium_count=medium_count,
-                low_count=low_count
+    except Exception as e:
+        db.rollback()
+        raise e
+    finally:
+        db.close()
+
+LEAD_TIME_CURSOR = "lead_times"
+
+@celery_app.task
+def update_lead_times():
+    """Fold issue_events appended since the last run into the time-to-DONE histograms"""
+    db: Session = SessionLocal()
+    try:
+        # Concurrent runs queue on the cursor row and each resumes where the previous one stopped
+        cursor = db.get(EventCursor, LEAD_TIME_CURSOR, with_for_update=True)
+        if cursor is None:
+            cursor = EventCursor(name=LEAD_TIME_CURSOR, position=0)
+            db.add(cursor)
+        if db.get_bind().dialect.name == "postgresql":
+            # Waits for transactions still inserting events, so no lower id can commit after we read the max
+            db.execute(text("LOCK TABLE issue_events IN SHARE MODE"))
+        
+        last_id = db.scalar(select(func.max(IssueEvent.id)))
+        if last_id is None or last_id <= cursor.position:
+            db.commit()
+            return "No new issue events"
+        
+        resolutions = db.execute(
+            select(Issue.severity, Issue.created_at, IssueEvent.created_at)
+            .join(Issue, Issue.id == IssueEvent.issue_id)
+            .where(
+                IssueEvent.id > cursor.position,
+                IssueEvent.id <= last_id,
+                IssueEvent.field == "status",
+                IssueEvent.new_value == IssueStatus.DONE.value,
+                # Events from NULL log creation (or the migration backfill), not a resolution
+                IssueEvent.old_value.isnot(None)
             )
-            db.add(stats)
+        ).all()
+        counts = Counter(
+            (severity, lead_time_bucket((done_at - created_at).total_seconds()))
+            for severity, created_at, done_at in resolutions
+        )
+        upsert_lead_time_buckets(db.connection(), counts)
+        cursor.position = last_id
         
         db.commit()
-        return f"Daily stats aggregated for {today}"
+        return f"Recorded {len(resolutions)} resolutions up to event {last_id}"
         
     except Exception as e:
         db.rollback()
         raise e
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
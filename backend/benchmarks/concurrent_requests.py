@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Concurrent request throughput against a running API.
+
+Fires --requests authenticated GETs at --path with --concurrency in flight while
+probing /health every 50ms. With a blocking database session the probes queue behind
+slow queries; with the async engine they stay flat. Run it once against a server
+started from the old code and once against the new code, same database and worker count:
+
+    uvicorn app.main:app --workers 1 &
+    python benchmarks/concurrent_requests.py --email admin@example.com --password password
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post("/api/v1/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+async def probe_health(client: httpx.AsyncClient, stop: asyncio.Event, latencies: list):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/health")
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0.05)
+
+async def run(args):
+    async with httpx.AsyncClient(base_url=args.url, timeout=60) as client:
+        token = args.token or await login(client, args.email, args.password)
+        headers = {"Authorization": f"Bearer {token}"}
+        semaphore = asyncio.Semaphore(args.concurrency)
+        latencies, health_latencies, failures = [], [], 0
+
+        async def one_request():
+            nonlocal failures
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(args.path, headers=headers)
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    failures += 1
+
+        stop = asyncio.Event()
+        prober = asyncio.create_task(probe_health(client, stop, health_latencies))
+        started = time.perf_counter()
+        await asyncio.gather(*(one_request() for _ in range(args.requests)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await prober
+
+    def ms(values, q):
+        return statistics.quantiles(values, n=100)[q - 1] * 1000 if len(values) > 1 else values[0] * 1000
+
+    print(f"{args.requests} x GET {args.path} at concurrency {args.concurrency}: {elapsed:.2f}s, "
+          f"{args.requests / elapsed:.1f} req/s, {failures} failures")
+    print(f"  request latency p50 {ms(latencies, 50):.1f}ms  p99 {ms(latencies, 99):.1f}ms")
+    print(f"  /health latency  p50 {ms(health_latencies, 50):.1f}ms  p99 {ms(health_latencies, 99):.1f}ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/api/v1/issues/")
+    parser.add_argument("--token", help="Bearer token; otherwise log in with --email/--password")
+    parser.add_argument("--email", default="admin@example.com")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=1000)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Login storm against a running API.
+
+Fires --logins concurrent POST /api/v1/auth/login requests (--concurrency in flight)
+while probing /health and an authenticated --probe-path every 50ms. With bcrypt run
+inline each login stalls the event loop for the whole hash and the probes queue behind
+it; with the bounded hash pool they keep their latency and excess logins get a fast 429.
+
+    uvicorn app.main:app --workers 1 &
+    python benchmarks/login_storm.py --email admin@example.com --password password
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+async def probe(client: httpx.AsyncClient, path: str, headers: dict, stop: asyncio.Event, latencies: list):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get(path, headers=headers)
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0.05)
+
+async def run(args):
+    credentials = {"email": args.email, "password": args.password}
+    async with httpx.AsyncClient(base_url=args.url, timeout=120) as client:
+        response = await client.post("/api/v1/auth/login", json=credentials)
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        statuses = {}
+
+        async def one_login():
+            async with semaphore:
+                response = await client.post("/api/v1/auth/login", json=credentials)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        stop = asyncio.Event()
+        health_latencies, api_latencies = [], []
+        probes = [
+            asyncio.create_task(probe(client, "/health", {}, stop, health_latencies)),
+            asyncio.create_task(probe(client, args.probe_path, headers, stop, api_latencies)),
+        ]
+        started = time.perf_counter()
+        await asyncio.gather(*(one_login() for _ in range(args.logins)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await asyncio.gather(*probes)
+
+    def ms(values, q):
+        return statistics.quantiles(values, n=100)[q - 1] * 1000 if len(values) > 1 else values[0] * 1000
+
+    succeeded = statuses.get(200, 0)
+    print(f"{args.logins} logins at concurrency {args.concurrency}: {elapsed:.2f}s, "
+          f"{succeeded / elapsed:.1f} successful logins/s, status counts {dict(sorted(statuses.items()))}")
+    print(f"  /health latency  p50 {ms(health_latencies, 50):.1f}ms  p99 {ms(health_latencies, 99):.1f}ms")
+    print(f"  {args.probe_path} latency  p50 {ms(api_latencies, 50):.1f}ms  p99 {ms(api_latencies, 99):.1f}ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--email", default="admin@example.com")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--probe-path", default="/api/v1/users/me")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--logins", type=int, default=500)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Serialization cost of issue payloads, without a database or server.
+
+Builds --count in-memory issues (each with a reporter and an assignee) and times:
+
+  baseline   response_model validation + jsonable_encoder + json.dumps for the HTTP body,
+             plus a second model_validate().model_dump() for the WebSocket broadcast
+  fast path  one dump_models() call whose dicts are encoded by orjson for both
+
+Run from backend/ with the usual environment (settings are read on import):
+
+    python benchmarks/serialize_issues.py --count 10000
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.responses import ORJSON_OPTIONS, dump_models  # noqa: E402
+from app.models.issue import Issue, IssueSeverity, IssueStatus  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.schemas.issue import IssueResponse  # noqa: E402
+
+def build_issues(count: int):
+    now = datetime.now(timezone.utc)
+    users = [
+        User(id=uuid.uuid4(), email=f"user{i}@example.com", name=f"User {i}", role=UserRole.REPORTER,
+             is_active=True, created_at=now, updated_at=now)
+        for i in range(50)
+    ]
+    issues = []
+    for i in range(count):
+        reporter, assignee = users[i % 50], users[(i + 1) % 50]
+        issues.append(Issue(
+            id=uuid.uuid4(), title=f"Issue {i}", description="Steps to reproduce " * 10,
+            severity=list(IssueSeverity)[i % 4], status=list(IssueStatus)[i % 4], tags=["bug", "ui"],
+            reporter_id=reporter.id, assignee_id=assignee.id, reporter=reporter, assignee=assignee,
+            files=[], created_at=now - timedelta(minutes=i), updated_at=now
+        ))
+    return issues
+
+def baseline(issues):
+    models = [IssueResponse.model_validate(issue) for issue in issues]
+    body = json.dumps(jsonable_encoder(models)).encode()
+    broadcast = str([IssueResponse.model_validate(issue).model_dump() for issue in issues])
+    return body, broadcast
+
+def fast_path(issues):
+    data = dump_models(IssueResponse, issues)
+    return orjson.dumps(data, option=ORJSON_OPTIONS), orjson.dumps(data, option=ORJSON_OPTIONS).decode()
+
+def timed(func, issues, repeat: int):
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(issues)
+        runs.append(time.perf_counter() - started)
+    return statistics.median(runs)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    issues = build_issues(args.count)
+    assert json.loads(baseline(issues)[0]) == json.loads(fast_path(issues)[0]), "HTTP bodies differ"
+
+    slow = timed(baseline, issues, args.repeat)
+    fast = timed(fast_path, issues, args.repeat)
+    print(f"{args.count} issues, median of {args.repeat} runs")
+    print(f"  baseline   {slow * 1000:8.1f}ms")
+    print(f"  fast path  {fast * 1000:8.1f}ms  ({slow / fast:.1f}x)")
+
+if __name__ == "__main__":
+    main()
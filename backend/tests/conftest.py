@@ -1,16 +1,26 @@
+import os
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from datetime import datetime, timezone
+
+# Tests recreate the database constantly, so a shared dashboard cache would serve other tests' numbers
+os.environ.setdefault("DASHBOARD_CACHE_ENABLED", "false")
+
 from app.main import app
-from app.database import get_db, Base
+from app.database import get_db, get_read_db, Base
 from app.models.user import User, UserRole
 from app.core.security import get_password_hash
+from app.core.principal_cache import principal_cache
+from app.core.analytics import tag_analytics_cache
 
-# Test database
+# Test database. create_all also builds the issues_fts FTS5 table that stands in
+# for the Postgres tsvector index when searching issues.
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 
 engine = create_engine(
@@ -20,14 +30,47 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
+# The API runs on the async engine. TestClient starts a fresh event loop per test,
+# so connections are not pooled across loops.
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+async def override_get_db():
+    async with TestingAsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
+
+@contextmanager
+def count_queries(max_queries):
+    """Fail if the wrapped block sends more than max_queries statements through the API's engine"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    assert len(statements) <= max_queries, (
+        f"Expected at most {max_queries} queries, got {len(statements)}:\n" + "\n".join(statements)
+    )
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # Users and issues are recreated in every test
+    principal_cache.clear()
+    tag_analytics_cache.clear()
+    yield
+    principal_cache.clear()
+    tag_analytics_cache.clear()
+
+@pytest.fixture
+def assert_max_queries():
+    return count_queries
 
 @pytest.fixture
 def client():
@@ -0,0 +1,135 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from app.core.pool_metrics import InstrumentedQueuePool, pool_stats
+from app.core.security import create_access_token
+
+def get_auth_headers(user):
+    token = create_access_token(data={"sub": user.email})
+    return {"Authorization": f"Bearer {token}"}
+
+def test_pool_stats_track_checkouts_and_timeouts():
+    engine = create_engine(
+        "sqlite:///./test.db",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        held = engine.connect()
+        stats = pool_stats(engine)
+        assert stats["checked_out"] == 1
+        assert stats["wait"]["count"] == 1
+
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        held.close()
+
+        stats = pool_stats(engine)
+        assert stats["checked_out"] == 0
+        assert stats["checked_in"] == 1
+        assert stats["wait"]["timeouts"] == 1
+        assert stats["wait"]["buckets_ms"]["+Inf"] == stats["wait"]["count"]
+    finally:
+        engine.dispose()
+
+def test_db_pool_stats_admin(client: TestClient, admin_user):
+    response = client.get("/api/v1/admin/db-pool", headers=get_auth_headers(admin_user))
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"api", "worker", "replicas"}
+    # SQLite URLs keep SQLAlchemy's default pool, which has no occupancy or wait histogram
+    for stats in (data["api"], data["worker"]):
+        assert "pool" in stats
+        if stats["pool"].startswith("Instrumented"):
+            assert "checked_out" in stats
+            assert "wait" in stats
+
+def test_db_pool_stats_requires_admin(client: TestClient, test_user):
+    response = client.get("/api/v1/admin/db-pool", headers=get_auth_headers(test_user))
+    assert response.status_code == 403
+
+def test_principal_cache_skips_user_query(client: TestClient, test_user, assert_max_queries):
+    headers = get_auth_headers(test_user)
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+    with assert_max_queries(0):
+        response = client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["email"] == test_user.email
+
+def test_principal_cache_invalidated_by_update_user(client: TestClient, test_user, admin_user):
+    headers = get_auth_headers(test_user)
+    admin_headers = get_auth_headers(admin_user)
+    assert client.get("/api/v1/users/me", headers=headers).json()["role"] == "REPORTER"
+
+    response = client.put(f"/api/v1/users/{test_user.id}", json={"role": "MAINTAINER"}, headers=admin_headers)
+    assert response.status_code == 200
+    assert client.get("/api/v1/users/me", headers=headers).json()["role"] == "MAINTAINER"
+
+    client.put(f"/api/v1/users/{test_user.id}", json={"is_active": False}, headers=admin_headers)
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 400
+
+    stats = client.get("/api/v1/admin/principal-cache", headers=admin_headers).json()
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 3
+
+@pytest.mark.asyncio
+async def test_principal_cache_evicts_and_expires(test_user, admin_user):
+    from app.core.principal_cache import PrincipalCache
+    cache = PrincipalCache(max_size=1, ttl=60)
+    await cache.set(test_user.email, test_user)
+    await cache.set(admin_user.email, admin_user)
+    assert await cache.get(test_user.email) is None
+    cached = await cache.get(admin_user.email)
+    assert cached.id == admin_user.id and cached.role == admin_user.role
+
+    expired = PrincipalCache(max_size=10, ttl=0)
+    await expired.set(test_user.email, test_user)
+    assert await expired.get(test_user.email) is None
+    assert expired.stats()["misses"] == 1
+
+@pytest.mark.asyncio
+async def test_principal_cache_invalidation_reaches_other_workers(test_user):
+    import asyncio
+    import uuid
+    import redis
+    from app.core.config import settings
+    from app.core.principal_cache import PrincipalCache
+    try:
+        redis.Redis.from_url(settings.REDIS_URL).ping()
+    except redis.exceptions.RedisError:
+        pytest.skip("Redis is not reachable")
+
+    channel = f"principal:invalidations:{uuid.uuid4()}"
+    workers = [PrincipalCache(max_size=10, ttl=60, redis_url=settings.REDIS_URL, channel=channel) for _ in range(2)]
+    for worker in workers:
+        await worker.start()
+        await asyncio.wait_for(worker.subscribed.wait(), 10)
+    updater, other = workers
+    try:
+        await updater.set(test_user.email, test_user)
+        assert (await other.get(test_user.email)).id == test_user.id
+        assert other.stats()["size"] == 1
+
+        await updater.invalidate(test_user.email)
+        for _ in range(50):
+            if not other.stats()["size"]:
+                break
+            await asyncio.sleep(0.05)
+        assert await other.get(test_user.email) is None
+
+        # A worker that is not subscribed cannot hear invalidations, so it skips its local tier
+        await other.set(test_user.email, test_user)
+        await other.stop()
+        await updater.invalidate(test_user.email)
+        assert await other.get(test_user.email) is None
+    finally:
+        for worker in workers:
+            await worker.stop()
+
+def test_websocket_stats_admin(client: TestClient, admin_user):
+    response = client.get("/api/v1/admin/websockets", headers=get_auth_headers(admin_user))
+    assert response.status_code == 200
+    assert set(response.json()) == {"connections", "queued", "queue_size", "dropped", "backplane"}
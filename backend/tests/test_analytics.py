@@ -0,0 +1,66 @@
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from app.core.analytics import (
+    load_tag_arrays, tag_cooccurrence, tag_trends, week_number, week_start
+)
+
+MONDAY = datetime(2026, 3, 2, 12, 0)
+
+def test_load_tag_arrays_encodes_tags():
+    arrays = load_tag_arrays([
+        (["ui", "bug"], MONDAY),
+        ([], MONDAY),
+        (None, MONDAY + timedelta(days=7)),
+        (["bug"], MONDAY + timedelta(days=8)),
+    ])
+    assert arrays.vocabulary.tolist() == ["bug", "ui"]
+    assert arrays.tag_ids.dtype == np.int32
+    assert arrays.tag_ids.tolist() == [1, 0, 0]
+    assert arrays.issue_ids.tolist() == [0, 0, 3]
+    assert arrays.weeks.tolist() == [week_number(MONDAY.date())] * 2 + [week_number(MONDAY.date()) + 1]
+    assert arrays.issue_count == 4
+
+def test_week_numbers_start_on_monday():
+    assert week_start(week_number(date(2026, 3, 8))) == date(2026, 3, 2)
+    assert week_number(date(2026, 3, 9)) == week_number(date(2026, 3, 8)) + 1
+
+def test_tag_cooccurrence_matches_pair_counts(monkeypatch):
+    # Small blocks so the accumulation crosses several of them
+    monkeypatch.setattr("app.core.analytics.COOCCURRENCE_CHUNK", 2)
+    arrays = load_tag_arrays([
+        (["a", "b"], MONDAY),
+        (["a", "b", "c"], MONDAY),
+        (["a", "c"], MONDAY),
+        (["a"], MONDAY),
+        (["d"], MONDAY),
+    ])
+    report = tag_cooccurrence(arrays, top=3, pair_limit=10)
+    assert report["tags"] == ["a", "b", "c"]
+    assert report["counts"] == [[4, 2, 2], [2, 2, 1], [2, 1, 2]]
+    assert report["pairs"] == [
+        {"tags": ["a", "b"], "count": 2},
+        {"tags": ["a", "c"], "count": 2},
+        {"tags": ["b", "c"], "count": 1},
+    ]
+
+def test_tag_trends_rank_week_over_week_change():
+    week = week_number(MONDAY.date())
+    rows = (
+        [(["growing"], MONDAY)] * 1 + [(["growing"], MONDAY + timedelta(days=7))] * 4
+        + [(["shrinking"], MONDAY)] * 3 + [(["shrinking"], MONDAY + timedelta(days=7))] * 1
+        + [(["collapsing"], MONDAY)] * 5
+        # Outside the window
+        + [(["old"], MONDAY - timedelta(days=21))]
+    )
+    report = tag_trends(load_tag_arrays(rows), last_week=week + 1, weeks=3, window=2, limit=10)
+    assert report["weeks"] == [date(2026, 2, 23), date(2026, 3, 2), date(2026, 3, 9)]
+    # Ranked by the size of the change, whichever way it went
+    assert [trend["tag"] for trend in report["tags"]] == ["collapsing", "growing", "shrinking"]
+    collapsing, growing, shrinking = report["tags"]
+    assert (collapsing["change"], collapsing["growth"]) == (-5, -1.0)
+    assert growing["counts"] == [0, 1, 4]
+    assert growing["rolling_mean"] == [0.0, 0.5, 2.5]
+    assert (growing["change"], growing["growth"]) == (3, 3.0)
+    assert (shrinking["change"], shrinking["growth"]) == (-2, -0.6667)
@@ -95,4 +95,87 @@ def test_update_user_not_found(client, admin_user):
         json={"name": "Ghost"},
         headers=headers
     )
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_password_hash_pool_backpressure():
+    import asyncio
+    import time
+    from fastapi import HTTPException
+    from app.core.security import PasswordHashPool
+    pool = PasswordHashPool(workers=1, queue_size=1)
+    busy = [asyncio.create_task(pool.run(time.sleep, 0.2)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    with pytest.raises(HTTPException) as exc_info:
+        await pool.run(time.sleep, 0)
+    assert exc_info.value.status_code == 429
+    await asyncio.gather(*busy)
+    # Slots are released once the queued work finishes
+    assert await pool.run(sum, [1, 2]) == 3
+
+def test_login_token_carries_principal_claims(client, test_user):
+    from app.core.security import decode_token
+    response = client.post("/api/v1/auth/login", json={"email": test_user.email, "password": "testpassword"})
+    claims = decode_token(response.json()["access_token"])
+    assert claims["sub"] == test_user.email
+    assert claims["uid"] == str(test_user.id)
+    assert claims["role"] == "REPORTER"
+    assert claims["ver"] == 0
+
+@pytest.fixture
+def stateless_auth(monkeypatch):
+    from app.core.config import settings
+    from app.core.revocation import token_revocations
+    monkeypatch.setattr(settings, "STATELESS_AUTH", True)
+    token_revocations.clear()
+    yield
+    token_revocations.clear()
+
+def test_stateless_auth_skips_user_lookup(client, test_user, stateless_auth, assert_max_queries):
+    response = client.post("/api/v1/auth/login", json={"email": test_user.email, "password": "testpassword"})
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    with assert_max_queries(20) as statements:
+        response = client.get("/api/v1/stats/dashboard", headers=headers)
+    assert response.status_code == 200
+    assert not any("FROM users" in statement for statement in statements)
+
+def test_stateless_auth_revokes_on_role_change(client, test_user, admin_user, stateless_auth):
+    from tests.test_issues import get_auth_headers
+    response = client.post("/api/v1/auth/login", json={"email": test_user.email, "password": "testpassword"})
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    assert client.get("/api/v1/issues/", headers=headers).status_code == 200
+
+    response = client.put(
+        f"/api/v1/users/{test_user.id}",
+        json={"role": "MAINTAINER"},
+        headers=get_auth_headers(admin_user)
+    )
+    assert response.status_code == 200
+    response = client.get("/api/v1/issues/", headers=headers)
+    assert response.status_code == 401
+
+    # A fresh login picks up the new version and role
+    response = client.post("/api/v1/auth/login", json={"email": test_user.email, "password": "testpassword"})
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    assert client.get("/api/v1/issues/", headers=headers).status_code == 200
+
+def test_stateless_auth_rejects_deactivated_user(client, test_user, admin_user, stateless_auth):
+    from tests.test_issues import get_auth_headers
+    credentials = {"email": test_user.email, "password": "testpassword"}
+    tokens = client.post("/api/v1/auth/login", json=credentials).json()
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    response = client.put(
+        f"/api/v1/users/{test_user.id}",
+        json={"is_active": False},
+        headers=get_auth_headers(admin_user)
+    )
+    assert response.status_code == 200
+    assert client.get("/api/v1/issues/", headers=headers).status_code == 401
+    assert client.get("/api/v1/stats/dashboard", headers=headers).status_code == 401
+
+    # Neither a fresh login nor a refresh can mint a token carrying the bumped version
+    assert client.post("/api/v1/auth/login", json=credentials).status_code == 400
+    response = client.post("/api/v1/auth/refresh", params={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 400
@@ -0,0 +1,47 @@
+import pytest
+from app.database import ReplicaRouter, async_database_url
+
+REPLICA_URL = "sqlite:///./test.db"
+# The directory does not exist, so connecting fails like an unreachable replica
+DEAD_REPLICA_URL = "sqlite:///./missing-replica-dir/replica.db"
+
+def test_async_database_url():
+    assert async_database_url("postgresql://u:p@db:5432/app") == "postgresql+asyncpg://u:p@db:5432/app"
+    assert async_database_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+
+@pytest.mark.asyncio
+async def test_replica_router_round_robin():
+    router = ReplicaRouter([REPLICA_URL, REPLICA_URL])
+    try:
+        picked = []
+        for _ in range(4):
+            db = await router.session()
+            picked.append(router.engines.index(db.bind))
+            await db.close()
+        assert picked == [0, 1, 0, 1]
+    finally:
+        for replica in router.engines:
+            await replica.dispose()
+
+@pytest.mark.asyncio
+async def test_replica_router_skips_unhealthy_replica():
+    router = ReplicaRouter([DEAD_REPLICA_URL, REPLICA_URL], retry_after=60)
+    try:
+        for _ in range(3):
+            db = await router.session()
+            assert db.bind is router.engines[1]
+            await db.close()
+        assert router._down_until[0] > 0
+    finally:
+        for replica in router.engines:
+            await replica.dispose()
+
+@pytest.mark.asyncio
+async def test_replica_router_returns_none_when_all_down():
+    router = ReplicaRouter([DEAD_REPLICA_URL], retry_after=60)
+    try:
+        assert await router.session() is None
+        # Still within the retry window, so the replica is not even tried
+        assert list(router.candidates()) == []
+    finally:
+        await router.engines[0].dispose()
@@ -45,3 +45,15 @@ def test_send_welcome_email(email_service):
         result = email_service.send_welcome_email("to@example.com", "User")
         assert result is True
         mock_send.assert_called_once()
+
+def test_send_issue_digest(email_service):
+    issues = [
+        {"id": "1", "title": "First", "status": "OPEN"},
+        {"id": "2", "title": "Second", "status": "DONE"},
+    ]
+    with patch.object(email_service, 'send_email', return_value=True) as mock_send:
+        result = email_service.send_issue_digest(["to@example.com"], issues, action="created")
+        assert result is True
+        subject, body = mock_send.call_args[0][1:3]
+        assert subject == "2 Issues Created"
+        assert "First" in body and "Second" in body
@@ -105,4 +105,373 @@ def test_dashboard_stats_authorized(client, test_user):
 
 def test_dashboard_stats_unauthorized(client):
     response = client.get("/api/v1/stats/dashboard")
-    assert response.status_code == 401
\ No newline at end of file
+    assert response.status_code == 401
+
+
+def test_get_issues_cursor_pagination(client, test_user, admin_user, db_session):
+    from datetime import datetime, timedelta
+    from app.models.issue import Issue, IssueSeverity
+    headers = get_auth_headers(test_user)
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    # Pairs share a timestamp so the id tie-breaker is exercised
+    for i in range(5):
+        db_session.add(Issue(
+            title=f"Issue {i}",
+            description="paged",
+            severity=IssueSeverity.HIGH if i % 2 else IssueSeverity.LOW,
+            reporter_id=test_user.id,
+            created_at=base + timedelta(minutes=i // 2)
+        ))
+    db_session.add(Issue(title="Other", description="not mine", reporter_id=admin_user.id, created_at=base))
+    db_session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/issues/", params=params, headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["items"]) <= 2
+        seen.extend(item["title"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    assert sorted(seen) == [f"Issue {i}" for i in range(5)]
+    assert seen[0] == "Issue 4"
+
+    response = client.get("/api/v1/issues/", params={"limit": 10, "severity": "HIGH"}, headers=headers)
+    assert [item["title"] for item in response.json()["items"]] == ["Issue 3", "Issue 1"]
+
+def test_get_issues_cursor_pagination_api_created(client, test_user):
+    headers = get_auth_headers(test_user)
+    for i in range(5):
+        response = client.post("/api/v1/issues/", json={"title": f"I{i}", "description": "paged"}, headers=headers)
+        assert response.status_code == 200
+
+    seen = []
+    cursor = None
+    for _ in range(10):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        data = client.get("/api/v1/issues/", params=params, headers=headers).json()
+        seen.extend(item["title"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    # Every issue exactly once, newest first, and the walk terminates
+    assert cursor is None
+    assert seen == ["I4", "I3", "I2", "I1", "I0"]
+
+def test_get_issues_invalid_cursor(client, test_user):
+    headers = get_auth_headers(test_user)
+    response = client.get("/api/v1/issues/", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert response.status_code == 400
+
+def test_issue_endpoints_query_count(client, test_user, admin_user, db_session, assert_max_queries):
+    from app.models.issue import Issue
+    from app.models.file import IssueFile
+    headers = get_auth_headers(admin_user)
+    issues = []
+    for i in range(10):
+        issue = Issue(
+            title=f"Issue {i}",
+            description="eager",
+            reporter_id=test_user.id,
+            assignee_id=admin_user.id
+        )
+        issue.files.append(IssueFile(
+            filename=f"f{i}.txt",
+            original_name=f"f{i}.txt",
+            file_path=f"uploads/f{i}.txt",
+            file_size=1,
+            content_type="text/plain",
+            uploaded_by=test_user.id
+        ))
+        db_session.add(issue)
+        issues.append(issue)
+    db_session.commit()
+    issue_id = issues[0].id
+
+    # auth lookup + ETag aggregate + issues + one batched load per relationship, independent of N
+    with assert_max_queries(6):
+        response = client.get("/api/v1/issues/", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 10
+    assert all(item["reporter"] and item["assignee"] and item["files"] for item in response.json())
+
+    with assert_max_queries(3):
+        response = client.get(f"/api/v1/issues/{issue_id}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["assignee"]["email"] == admin_user.email
+
+    with assert_max_queries(6):
+        response = client.put(f"/api/v1/issues/{issue_id}", json={"title": "Renamed"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["title"] == "Renamed"
+
+def test_get_issues_sparse_fields(client, test_user, assert_max_queries):
+    headers = get_auth_headers(test_user)
+    client.post(
+        "/api/v1/issues/",
+        json={"title": "Kanban", "description": "long text", "severity": "MEDIUM", "tags": []},
+        headers=headers
+    )
+
+    with assert_max_queries(3) as statements:
+        response = client.get(
+            "/api/v1/issues/",
+            params={"fields": "id,title,status,severity,assignee_id"},
+            headers=headers
+        )
+    assert response.status_code == 200
+    assert response.json() == [{
+        "id": response.json()[0]["id"],
+        "title": "Kanban",
+        "status": "OPEN",
+        "severity": "MEDIUM",
+        "assignee_id": None
+    }]
+    assert "description" not in statements[-1]
+
+    response = client.get("/api/v1/issues/", params={"fields": "title", "limit": 5}, headers=headers)
+    assert response.json() == {"items": [{"title": "Kanban"}], "next_cursor": None}
+
+    response = client.get("/api/v1/issues/", params={"fields": "title,hashed_password"}, headers=headers)
+    assert response.status_code == 400
+
+def test_export_issues(client, test_user, admin_user, db_session):
+    import csv
+    import io
+    import json
+    from app.models.issue import Issue
+    reporter_headers = get_auth_headers(test_user)
+    admin_headers = get_auth_headers(admin_user)
+    db_session.add(Issue(title="Mine", description="export", reporter_id=test_user.id, tags=["a", "b"]))
+    db_session.add(Issue(title="Admin's", description="export", reporter_id=admin_user.id, tags=["a", "b"]))
+    db_session.commit()
+
+    response = client.get("/api/v1/issues/export", headers=reporter_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["title"] for row in rows] == ["Mine"]
+    assert rows[0]["tags"] == ["a", "b"]
+    assert rows[0]["status"] == "OPEN"
+
+    response = client.get("/api/v1/issues/export", params={"format": "csv"}, headers=admin_headers)
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert sorted(row["title"] for row in rows) == ["Admin's", "Mine"]
+    assert rows[0]["tags"] == "a;b"
+    assert rows[0]["assignee_id"] == ""
+    assert rows[0]["severity"] == "LOW"
+    assert rows[0]["status"] == "OPEN"
+
+    response = client.get("/api/v1/issues/export", params={"format": "xml"}, headers=admin_headers)
+    assert response.status_code == 422
+
+def test_search_issues(client, test_user, admin_user, db_session):
+    from app.models.issue import Issue, IssueSeverity
+    headers = get_auth_headers(test_user)
+    db_session.add_all([
+        Issue(title="Login page broken", description="Mobile users cannot login", severity=IssueSeverity.HIGH, reporter_id=test_user.id),
+        Issue(title="Slow dashboard", description="The login flow is fine but charts are slow", reporter_id=test_user.id),
+        Issue(title="Unrelated", description="Nothing to see", reporter_id=test_user.id),
+        Issue(title="Login for admins", description="Not visible to the reporter", reporter_id=admin_user.id),
+    ])
+    db_session.commit()
+
+    response = client.get("/api/v1/issues/", params={"q": "login"}, headers=headers)
+    assert response.status_code == 200
+    # Two mentions of "login" outrank one; the admin's issue stays hidden
+    assert [item["title"] for item in response.json()] == ["Login page broken", "Slow dashboard"]
+
+    response = client.get("/api/v1/issues/", params={"q": "login", "severity": "HIGH", "limit": 5}, headers=headers)
+    assert [item["title"] for item in response.json()["items"]] == ["Login page broken"]
+
+    # Edits are picked up by the index
+    issue = db_session.query(Issue).filter(Issue.title == "Unrelated").one()
+    response = client.put(f"/api/v1/issues/{issue.id}", json={"description": "login timeout"}, headers=headers)
+    assert response.status_code == 200
+    response = client.get("/api/v1/issues/", params={"q": "timeout", "fields": "title"}, headers=headers)
+    assert response.json() == [{"title": "Unrelated"}]
+
+    # FTS query syntax in user input is treated as plain words
+    response = client.get("/api/v1/issues/", params={"q": "timeout AND (\""}, headers=headers)
+    assert response.status_code == 200
+
+    response = client.get("/api/v1/issues/", params={"q": "login", "cursor": "x"}, headers=headers)
+    assert response.status_code == 400
+
+def test_filter_issues_by_tags(client, test_user, admin_user, db_session):
+    from app.models.issue import Issue
+    headers = get_auth_headers(test_user)
+    db_session.add_all([
+        Issue(title="Both", description="d", tags=["backend", "database"], reporter_id=test_user.id),
+        Issue(title="Backend", description="d", tags=["backend"], reporter_id=test_user.id),
+        Issue(title="Frontend", description="d", tags=["frontend"], reporter_id=test_user.id),
+        Issue(title="Untagged", description="d", tags=[], reporter_id=test_user.id),
+        Issue(title="Hidden", description="d", tags=["backend", "database"], reporter_id=admin_user.id),
+    ])
+    db_session.commit()
+
+    def titles(params):
+        response = client.get("/api/v1/issues/", params={**params, "fields": "title"}, headers=headers)
+        assert response.status_code == 200
+        return sorted(item["title"] for item in response.json())
+
+    assert titles({"tags": ["database", "frontend"]}) == ["Both", "Frontend"]
+    assert titles({"tags": ["backend", "database"], "tags_match": "all"}) == ["Both"]
+    assert titles({"tags": ["backend", "backend"], "tags_match": "all"}) == ["Backend", "Both"]
+    assert titles({"tags": ["missing"]}) == []
+
+    response = client.get("/api/v1/issues/tags/facets", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == [
+        {"tag": "backend", "count": 2},
+        {"tag": "database", "count": 1},
+        {"tag": "frontend", "count": 1},
+    ]
+
+    response = client.get("/api/v1/issues/tags/facets", headers=get_auth_headers(admin_user))
+    assert response.json()[0] == {"tag": "backend", "count": 3}
+
+def test_issue_etags(client, test_user, db_session, assert_max_queries):
+    from datetime import datetime
+    from app.models.issue import Issue
+    headers = get_auth_headers(test_user)
+    issue = Issue(title="Polled", description="d", reporter_id=test_user.id, updated_at=datetime(2025, 1, 1))
+    db_session.add(issue)
+    db_session.commit()
+
+    response = client.get(f"/api/v1/issues/{issue.id}", headers=headers)
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    # Revalidation is decided from the narrow lookup alone
+    with assert_max_queries(2):
+        response = client.get(f"/api/v1/issues/{issue.id}", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    list_response = client.get("/api/v1/issues/", headers=headers)
+    list_etag = list_response.headers["ETag"]
+    with assert_max_queries(2):
+        response = client.get("/api/v1/issues/", headers={**headers, "If-None-Match": list_etag})
+    assert response.status_code == 304
+    response = client.get("/api/v1/issues/", params={"fields": "title"}, headers={**headers, "If-None-Match": list_etag})
+    assert response.status_code == 200
+
+    client.put(f"/api/v1/issues/{issue.id}", json={"title": "Changed"}, headers=headers)
+    response = client.get(f"/api/v1/issues/{issue.id}", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    response = client.get("/api/v1/issues/", headers={**headers, "If-None-Match": list_etag})
+    assert response.status_code == 200
+
+def test_bulk_create_issues(client, test_user, admin_user, assert_max_queries):
+    from unittest.mock import patch
+    headers = get_auth_headers(test_user)
+    items = [
+        {"title": f"Bulk {i}", "description": "ingested", "severity": "MEDIUM", "tags": ["bulk"]}
+        for i in range(50)
+    ]
+    with patch("app.api.v1.issues.send_issue_digest_task") as digest_task, assert_max_queries(8):
+        response = client.post("/api/v1/issues/bulk", json={"items": items}, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert [issue["title"] for issue in data["issues"]] == [f"Bulk {i}" for i in range(50)]
+    assert data["errors"] == []
+    digest_task.delay.assert_called_once()
+    recipients, action = digest_task.delay.call_args[0]
+    assert list(recipients) == [admin_user.email]
+    assert len(recipients[admin_user.email]) == 50
+    assert action == "created"
+
+    response = client.get("/api/v1/issues/", params={"fields": "id"}, headers=headers)
+    assert len(response.json()) == 50
+
+    response = client.post("/api/v1/issues/bulk", json={"items": []}, headers=headers)
+    assert response.status_code == 422
+
+def test_bulk_update_issues(client, test_user, admin_user, db_session):
+    from unittest.mock import patch
+    from app.models.issue import Issue, IssueStatus
+    headers = get_auth_headers(test_user)
+    mine = [Issue(title=f"Mine {i}", description="d", reporter_id=test_user.id) for i in range(3)]
+    theirs = Issue(title="Theirs", description="d", reporter_id=admin_user.id)
+    db_session.add_all(mine + [theirs])
+    db_session.commit()
+    missing_id = str(uuid.uuid4())
+
+    items = [
+        {"id": str(mine[0].id), "status": "DONE"},
+        {"id": str(theirs.id), "status": "DONE"},
+        {"id": str(mine[1].id), "title": "Renamed"},
+        {"id": missing_id, "status": "DONE"},
+        {"id": str(mine[2].id), "status": "TRIAGED", "assignee_id": str(admin_user.id)},
+    ]
+    with patch("app.api.v1.issues.send_issue_digest_task") as digest_task:
+        response = client.patch("/api/v1/issues/bulk", json={"items": items}, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert [issue["title"] for issue in data["issues"]] == ["Mine 0", "Renamed", "Mine 2"]
+    assert data["errors"] == [
+        {"index": 1, "id": str(theirs.id), "detail": "Not enough permissions"},
+        {"index": 3, "id": missing_id, "detail": "Issue not found"},
+    ]
+    # Reporters cannot assign, so the assignee change is dropped like in update_issue
+    assert data["issues"][2]["assignee_id"] is None
+
+    digest_task.delay.assert_called_once()
+    recipients, action = digest_task.delay.call_args[0]
+    assert {issue["title"] for issue in recipients[test_user.email]} == {"Mine 0", "Mine 2"}
+    assert action == "updated"
+
+    db_session.expire_all()
+    assert db_session.get(Issue, theirs.id).status == IssueStatus.OPEN
+
+def test_bulk_update_unknown_assignee(client, test_user, admin_user, db_session):
+    from unittest.mock import patch
+    from app.models.issue import Issue
+    issues = [Issue(title=f"Issue {i}", description="d", reporter_id=test_user.id) for i in range(3)]
+    db_session.add_all(issues)
+    db_session.commit()
+    ghost_id = str(uuid.uuid4())
+
+    items = [
+        {"id": str(issues[0].id), "assignee_id": str(test_user.id)},
+        {"id": str(issues[1].id), "assignee_id": ghost_id, "status": "DONE"},
+        {"id": str(issues[2].id), "status": "TRIAGED"},
+    ]
+    with patch("app.api.v1.issues.send_issue_digest_task"):
+        response = client.patch("/api/v1/issues/bulk", json={"items": items}, headers=get_auth_headers(admin_user))
+    assert response.status_code == 200
+    data = response.json()
+    assert data["errors"] == [{"index": 1, "id": str(issues[1].id), "detail": "Assignee not found"}]
+    assert [(issue["title"], issue["assignee_id"], issue["status"]) for issue in data["issues"]] == [
+        ("Issue 0", str(test_user.id), "OPEN"),
+        ("Issue 2", None, "TRIAGED"),
+    ]
+
+    db_session.expire_all()
+    assert db_session.get(Issue, issues[1].id).status.value == "OPEN"
+
+def test_broadcast_reuses_response_body(client, test_user):
+    import json
+    from unittest.mock import AsyncMock, patch
+    headers = get_auth_headers(test_user)
+    with patch("app.main.websocket_manager.broadcast", new_callable=AsyncMock) as broadcast:
+        response = client.post(
+            "/api/v1/issues/",
+            json={"title": "Broadcast", "description": "d", "severity": "LOW", "tags": []},
+            headers=headers
+        )
+    assert response.status_code == 200
+    message = json.loads(broadcast.call_args[0][0])
+    assert message["type"] == "issue_update"
+    assert message["data"] == {"action": "created", "issue": response.json()}
@@ -0,0 +1,389 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.core.security import create_access_token
+from app.models.issue import Issue, IssueStatus, IssueSeverity
+
+def get_auth_headers(user):
+    token = create_access_token(data={"sub": user.email})
+    return {"Authorization": f"Bearer {token}"}
+
+def seed_issues(db_session, test_user, admin_user):
+    rows = [
+        (test_user, IssueStatus.OPEN, IssueSeverity.HIGH),
+        (test_user, IssueStatus.OPEN, IssueSeverity.LOW),
+        (test_user, IssueStatus.DONE, IssueSeverity.HIGH),
+        (admin_user, IssueStatus.IN_PROGRESS, IssueSeverity.CRITICAL),
+        (admin_user, IssueStatus.TRIAGED, IssueSeverity.MEDIUM),
+    ]
+    db_session.add_all([
+        Issue(title=f"Issue {i}", description="d", reporter_id=user.id, status=status, severity=severity)
+        for i, (user, status, severity) in enumerate(rows)
+    ])
+    db_session.commit()
+
+def test_dashboard_stats_single_query(client: TestClient, db_session, test_user, admin_user, assert_max_queries):
+    seed_issues(db_session, test_user, admin_user)
+    headers = get_auth_headers(admin_user)
+    # Warm the principal cache so only the stats query remains
+    client.get("/api/v1/users/me", headers=headers)
+    with assert_max_queries(1):
+        response = client.get("/api/v1/stats/dashboard", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {
+        "total_issues": 5,
+        "open_issues": 2,
+        "in_progress_issues": 1,
+        "closed_issues": 1,
+        "issues_by_severity": {"LOW": 1, "MEDIUM": 1, "HIGH": 2, "CRITICAL": 1},
+        "issues_by_status": {"OPEN": 2, "TRIAGED": 1, "IN_PROGRESS": 1, "DONE": 1},
+    }
+
+def test_dashboard_stats_reporter_scope(client: TestClient, db_session, test_user, admin_user, assert_max_queries):
+    seed_issues(db_session, test_user, admin_user)
+    headers = get_auth_headers(test_user)
+    client.get("/api/v1/users/me", headers=headers)
+    with assert_max_queries(1) as statements:
+        response = client.get("/api/v1/stats/dashboard", headers=headers)
+    # Served from the reporter's issue_counters rows, never from issues
+    assert "FROM issue_counters" in statements[0] and "FROM issues" not in statements[0]
+    data = response.json()
+    assert data["total_issues"] == 3
+    assert data["issues_by_severity"] == {"LOW": 1, "MEDIUM": 0, "HIGH": 2, "CRITICAL": 0}
+    assert data["issues_by_status"] == {"OPEN": 2, "TRIAGED": 0, "IN_PROGRESS": 0, "DONE": 1}
+
+def test_dashboard_stats_read_primary(client: TestClient, db_session, test_user, monkeypatch):
+    from app.database import get_read_db
+    from app.main import app
+
+    async def lagging_replica():
+        raise AssertionError("dashboard stats are cached, so they must not come from a replica")
+        yield
+
+    monkeypatch.setitem(app.dependency_overrides, get_read_db, lagging_replica)
+    response = client.get("/api/v1/stats/dashboard", headers=get_auth_headers(test_user))
+    assert response.status_code == 200
+
+def test_reporter_counters_are_primary_key_lookups(db_session, test_user):
+    from sqlalchemy import func, select
+    from app.models.issue_counter import IssueCounter
+    query = select(IssueCounter.status, IssueCounter.severity, func.sum(IssueCounter.count)).where(
+        IssueCounter.reporter_id == test_user.id
+    ).group_by(IssueCounter.status, IssueCounter.severity)
+    compiled = query.compile(db_session.get_bind())
+    plan = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", (test_user.id.hex,)).all()
+    details = " ".join(row[-1] for row in plan)
+    assert "SEARCH issue_counters USING INDEX" in details and "reporter_id=?" in details
+
+def counter_rows(db_session):
+    from app.models.issue_counter import IssueCounter
+    db_session.expire_all()
+    return {
+        (counter.reporter_id, counter.status, counter.severity): counter.count
+        for counter in db_session.query(IssueCounter).all()
+        if counter.count
+    }
+
+def actual_counts(db_session):
+    from sqlalchemy import func
+    rows = db_session.query(Issue.reporter_id, Issue.status, Issue.severity, func.count(Issue.id)).group_by(
+        Issue.reporter_id, Issue.status, Issue.severity
+    ).all()
+    return {(reporter_id, status, severity): count for reporter_id, status, severity, count in rows}
+
+def test_issue_counters_follow_writes(client: TestClient, db_session, test_user):
+    from unittest.mock import patch
+    headers = get_auth_headers(test_user)
+    created = client.post(
+        "/api/v1/issues/",
+        json={"title": "Counted", "description": "d", "severity": "HIGH", "tags": []},
+        headers=headers
+    ).json()
+    with patch("app.api.v1.issues.send_issue_digest_task"):
+        client.post(
+            "/api/v1/issues/bulk",
+            json={"items": [{"title": f"Bulk {i}", "description": "d", "severity": "LOW"} for i in range(3)]},
+            headers=headers
+        )
+    assert counter_rows(db_session) == {
+        (test_user.id, IssueStatus.OPEN, IssueSeverity.HIGH): 1,
+        (test_user.id, IssueStatus.OPEN, IssueSeverity.LOW): 3,
+    }
+
+    client.put(f"/api/v1/issues/{created['id']}", json={"severity": "CRITICAL"}, headers=headers)
+    assert counter_rows(db_session) == actual_counts(db_session)
+
+    client.delete(f"/api/v1/issues/{created['id']}", headers=headers)
+    assert counter_rows(db_session) == actual_counts(db_session)
+    assert client.get("/api/v1/stats/dashboard", headers=headers).json()["total_issues"] == 3
+
+def test_reconcile_issue_counters(db_session, test_user, admin_user):
+    from unittest.mock import patch
+    from app.models.issue_counter import IssueCounter
+    from app.workers import tasks
+    from tests.conftest import TestingSessionLocal
+    seed_issues(db_session, test_user, admin_user)
+    expected = counter_rows(db_session)
+    db_session.query(IssueCounter).delete()
+    db_session.add(IssueCounter(reporter_id=admin_user.id, status=IssueStatus.DONE, severity=IssueSeverity.LOW, count=7))
+    db_session.commit()
+
+    with patch("app.workers.tasks.SessionLocal", TestingSessionLocal):
+        result = tasks.reconcile_issue_counters()
+    assert result == f"Reconciled {len(expected) + 1} issue counters"
+    assert counter_rows(db_session) == expected == actual_counts(db_session)
+
+def test_aggregate_daily_stats_reads_counters(db_session, test_user, admin_user):
+    from unittest.mock import patch
+    from app.models.daily_stats import DailyStats
+    from app.workers import tasks
+    from tests.conftest import TestingSessionLocal
+    seed_issues(db_session, test_user, admin_user)
+    with patch("app.workers.tasks.SessionLocal", TestingSessionLocal):
+        tasks.aggregate_daily_stats()
+        # A second run for the same day overwrites the row in place
+        db_session.delete(db_session.query(Issue).filter(Issue.status == IssueStatus.DONE).one())
+        db_session.commit()
+        tasks.aggregate_daily_stats()
+    db_session.expire_all()
+    stats = db_session.query(DailyStats).one()
+    assert (stats.total_issues, stats.open_issues, stats.done_issues) == (4, 2, 0)
+    assert (stats.critical_count, stats.high_count, stats.medium_count, stats.low_count) == (1, 1, 1, 1)
+
+@pytest.mark.asyncio
+async def test_dashboard_cache_singleflight():
+    import asyncio
+    from app.core.dashboard_cache import DashboardCache
+    cache = DashboardCache(None, ttl=60)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"total_issues": len(calls)}
+
+    results = await asyncio.gather(*(cache.get_or_compute("global", compute) for _ in range(10)))
+    assert len(calls) == 1
+    assert results == [{"total_issues": 1}] * 10
+    # Nothing is cached without Redis, so the next miss computes again
+    assert await cache.get_or_compute("global", compute) == {"total_issues": 2}
+
+@pytest.mark.asyncio
+async def test_dashboard_cache_redis_versioning():
+    import uuid
+    import redis
+    from app.core.config import settings
+    from app.core.dashboard_cache import DashboardCache, reporter_scope
+    try:
+        redis.Redis.from_url(settings.REDIS_URL).ping()
+    except redis.exceptions.RedisError:
+        pytest.skip("Redis is not reachable")
+
+    cache = DashboardCache(settings.REDIS_URL, ttl=60)
+    reporter_id = uuid.uuid4()
+    scope = reporter_scope(reporter_id)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"total_issues": len(calls)}
+
+    assert await cache.get_or_compute(scope, compute) == {"total_issues": 1}
+    assert await cache.get_or_compute(scope, compute) == {"total_issues": 1}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    await cache.invalidate([reporter_id])
+    assert await cache.get_or_compute(scope, compute) == {"total_issues": 2}
+
+    # An invalidation lost to a Redis outage must not let the old entry be served afterwards
+    from unittest.mock import patch
+    with patch.object(cache._redis, "pipeline", side_effect=redis.exceptions.ConnectionError("down")):
+        await cache.invalidate([reporter_id])
+    assert await cache.get_or_compute(scope, compute) == {"total_issues": 3}
+    cache._down_until = 0.0  # retry_after has passed and Redis is back
+    assert await cache.get_or_compute(scope, compute) == {"total_issues": 4}
+    assert await cache.get_or_compute(scope, compute) == {"total_issues": 4}
+
+def seed_daily_stats(db_session, start, days):
+    from datetime import timedelta
+    from app.models.daily_stats import DailyStats
+    db_session.add_all([
+        DailyStats(date=start + timedelta(days=i), total_issues=i, open_issues=i, done_issues=0)
+        for i in range(days)
+    ])
+    db_session.commit()
+
+def test_stats_timeseries_buckets(client: TestClient, db_session, admin_user):
+    from datetime import date
+    from unittest.mock import patch
+    from app.workers import tasks
+    from tests.conftest import TestingSessionLocal
+    # Monday 2026-01-05 through Sunday 2026-03-01: 8 full weeks over three months
+    seed_daily_stats(db_session, date(2026, 1, 5), 56)
+    with patch("app.workers.tasks.SessionLocal", TestingSessionLocal):
+        assert tasks.rebuild_stats_rollups() == "Rebuilt 11 stats rollups"
+    headers = get_auth_headers(admin_user)
+    params = {"from": "2026-01-01", "to": "2026-03-31"}
+
+    days = client.get("/api/v1/stats/timeseries", params=params, headers=headers).json()
+    assert days["bucket"] == "day"
+    assert len(days["points"]) == 56
+
+    weeks = client.get("/api/v1/stats/timeseries", params={**params, "bucket": "week"}, headers=headers).json()
+    assert [point["period_start"] for point in weeks["points"]][:2] == ["2026-01-05", "2026-01-12"]
+    assert len(weeks["points"]) == 8
+    # Each week carries the snapshot of its last day
+    assert weeks["points"][0]["date"] == "2026-01-11"
+    assert weeks["points"][0]["total_issues"] == 6
+
+    months = client.get("/api/v1/stats/timeseries", params={**params, "bucket": "month"}, headers=headers).json()
+    assert [(point["period_start"], point["date"]) for point in months["points"]] == [
+        ("2026-01-01", "2026-01-31"), ("2026-02-01", "2026-02-28"), ("2026-03-01", "2026-03-01")
+    ]
+
+def test_stats_timeseries_validation(client: TestClient, test_user, admin_user):
+    params = {"from": "2026-02-01", "to": "2026-01-01"}
+    response = client.get("/api/v1/stats/timeseries", params=params, headers=get_auth_headers(admin_user))
+    assert response.status_code == 400
+    response = client.get("/api/v1/stats/timeseries", headers=get_auth_headers(test_user))
+    assert response.status_code == 403
+
+def test_aggregate_daily_stats_updates_rollups(db_session, admin_user):
+    from datetime import date
+    from unittest.mock import patch
+    from app.models.stats_rollup import StatsRollup
+    from app.workers import tasks
+    from tests.conftest import TestingSessionLocal
+    with patch("app.workers.tasks.SessionLocal", TestingSessionLocal):
+        tasks.aggregate_daily_stats()
+    rollups = {rollup.period: rollup for rollup in db_session.query(StatsRollup).all()}
+    assert set(rollups) == {"week", "month"}
+    assert rollups["month"].period_start == date.today().replace(day=1)
+    assert rollups["week"].date == date.today()
+
+def issue_events(db_session, issue_id):
+    from app.models.issue_event import IssueEvent
+    db_session.expire_all()
+    events = db_session.query(IssueEvent).filter(IssueEvent.issue_id == issue_id).order_by(IssueEvent.id).all()
+    return [(event.field, event.old_value, event.new_value) for event in events]
+
+def test_issue_events_follow_writes(client: TestClient, db_session, test_user, admin_user):
+    from unittest.mock import patch
+    from uuid import UUID
+    headers = get_auth_headers(admin_user)
+    with patch("app.api.v1.issues.send_issue_notification_task"):
+        response = client.post("/api/v1/issues/", json={"title": "T", "description": "d", "severity": "HIGH"}, headers=headers)
+        issue_id = UUID(response.json()["id"])
+        client.put(f"/api/v1/issues/{issue_id}", json={"status": "TRIAGED"}, headers=headers)
+        # Untracked fields and unchanged values log nothing
+        client.put(f"/api/v1/issues/{issue_id}", json={"title": "Renamed", "status": "TRIAGED"}, headers=headers)
+        client.put(f"/api/v1/issues/{issue_id}", json={"severity": "LOW"}, headers=headers)
+    db_session.get(Issue, issue_id).assignee_id = test_user.id
+    db_session.commit()
+    assert issue_events(db_session, issue_id) == [
+        ("status", None, "OPEN"),
+        ("severity", None, "HIGH"),
+        ("status", "OPEN", "TRIAGED"),
+        ("severity", "HIGH", "LOW"),
+        ("assignee_id", None, str(test_user.id)),
+    ]
+
+def test_bulk_create_logs_issue_events(client: TestClient, db_session, admin_user):
+    from unittest.mock import patch
+    from uuid import UUID
+    items = [{"title": "A", "description": "d", "severity": "CRITICAL"}]
+    with patch("app.api.v1.issues.send_issue_digest_task"):
+        response = client.post("/api/v1/issues/bulk", json={"items": items}, headers=get_auth_headers(admin_user))
+    issue_id = UUID(response.json()["issues"][0]["id"])
+    assert issue_events(db_session, issue_id) == [("status", None, "OPEN"), ("severity", None, "CRITICAL")]
+
+def test_lead_time_stats_incremental(client: TestClient, db_session, test_user, admin_user):
+    from datetime import datetime, timedelta
+    from unittest.mock import patch
+    from app.models.lead_time import LeadTimeBucket
+    from app.workers import tasks
+    from tests.conftest import TestingSessionLocal
+    now = datetime.utcnow()
+    issues = [
+        Issue(title=f"Issue {i}", description="d", reporter_id=test_user.id, severity=IssueSeverity.HIGH,
+              created_at=now - timedelta(hours=hours))
+        for i, hours in enumerate((1, 2, 10))
+    ]
+    db_session.add_all(issues)
+    db_session.commit()
+    for issue in issues[:2]:
+        issue.status = IssueStatus.DONE
+    db_session.commit()
+
+    with patch("app.workers.tasks.SessionLocal", TestingSessionLocal):
+        assert tasks.update_lead_times().startswith("Recorded 2 resolutions")
+        assert tasks.update_lead_times() == "No new issue events"
+        issues[2].status = IssueStatus.DONE
+        db_session.commit()
+        # Only the new event is read; the earlier resolutions stay counted once
+        assert tasks.update_lead_times().startswith("Recorded 1 resolutions")
+    db_session.expire_all()
+    assert sum(row.count for row in db_session.query(LeadTimeBucket).all()) == 3
+
+    response = client.get("/api/v1/stats/lead-time", headers=get_auth_headers(admin_user))
+    assert response.status_code == 200
+    high = response.json()["by_severity"]["HIGH"]
+    assert high["resolved"] == 3
+    # Histogram buckets are accurate to within about 12%
+    assert 1.7 <= high["median_hours"] <= 2.3
+    assert 8.8 <= high["p90_hours"] <= 11.2
+    assert response.json()["by_severity"]["LOW"] == {"resolved": 0, "median_hours": None, "p90_hours": None}
+
+    response = client.get("/api/v1/stats/lead-time", headers=get_auth_headers(test_user))
+    assert response.status_code == 403
+
+def test_lead_times_skip_issues_done_before_events(db_session, test_user):
+    from datetime import datetime, timedelta
+    from unittest.mock import patch
+    from app.models.issue_event import IssueEvent
+    from app.models.lead_time import LeadTimeBucket
+    from app.workers import tasks
+    from tests.conftest import TestingSessionLocal
+    # Like the backfill for issues already DONE when issue_events was added: a status event from NULL
+    issue = Issue(title="Old", description="d", reporter_id=test_user.id, severity=IssueSeverity.LOW,
+                  status=IssueStatus.DONE, created_at=datetime.utcnow() - timedelta(days=30))
+    db_session.add(issue)
+    db_session.commit()
+    assert ("status", None, "DONE") in issue_events(db_session, issue.id)
+
+    with patch("app.workers.tasks.SessionLocal", TestingSessionLocal):
+        assert tasks.update_lead_times().startswith("Recorded 0 resolutions")
+    db_session.expire_all()
+    assert db_session.query(LeadTimeBucket).count() == 0
+    assert db_session.query(IssueEvent).count() > 0
+
+def test_tag_analytics_cached_until_aggregation(client: TestClient, db_session, test_user, admin_user):
+    from datetime import datetime, timedelta
+    from unittest.mock import patch
+    from app.workers import tasks
+    from tests.conftest import TestingSessionLocal
+    last_week = datetime.utcnow() - timedelta(days=7)
+    db_session.add_all([
+        Issue(title=f"Issue {i}", description="d", reporter_id=test_user.id, tags=tags, created_at=last_week)
+        for i, tags in enumerate((["ui", "login"], ["ui", "login"], ["ui"]))
+    ])
+    db_session.commit()
+    headers = get_auth_headers(admin_user)
+
+    response = client.get("/api/v1/stats/tags/cooccurrence", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["pairs"] == [{"tags": ["ui", "login"], "count": 2}]
+    trends = client.get("/api/v1/stats/tags/trends", params={"weeks": 2}, headers=headers).json()
+    assert [(trend["tag"], trend["counts"]) for trend in trends["tags"]] == [("ui", [0, 3]), ("login", [0, 2])]
+
+    db_session.add(Issue(title="New", description="d", reporter_id=test_user.id, tags=["ui", "login"], created_at=last_week))
+    db_session.commit()
+    # Served from the cache until daily stats are aggregated again
+    response = client.get("/api/v1/stats/tags/cooccurrence", headers=headers)
+    assert response.json()["pairs"] == [{"tags": ["ui", "login"], "count": 2}]
+    with patch("app.workers.tasks.SessionLocal", TestingSessionLocal):
+        tasks.aggregate_daily_stats()
+    response = client.get("/api/v1/stats/tags/cooccurrence", headers=headers)
+    assert response.json()["pairs"] == [{"tags": ["ui", "login"], "count": 3}]
+
+    response = client.get("/api/v1/stats/tags/trends", headers=get_auth_headers(test_user))
+    assert response.status_code == 403
@@ -1,36 +1,41 @@
 import pytest
 from unittest.mock import patch, MagicMock
+from app.models.stats_rollup import SNAPSHOT_COLUMNS
 from app.workers import tasks
 
 def test_aggregate_daily_stats_success():
     with patch("app.workers.tasks.SessionLocal") as mock_session_local:
         mock_db = MagicMock()
         mock_session_local.return_value = mock_db
-        mock_db.query().filter().first.return_value = None  # No existing stats
-        mock_db.query().count.return_value = 5
-        mock_db.query().filter().count.return_value = 2
+        mock_db.get_bind().dialect.name = "sqlite"
+        mock_db.execute().one()._mapping = {column: 2 for column in SNAPSHOT_COLUMNS}
+        mock_db.execute.reset_mock()
+        mock_db.query().filter().order_by().first.return_value = None  # No daily rows for rollups
         result = tasks.aggregate_daily_stats()
         assert "Daily stats aggregated" in result
+        # One aggregate SELECT and one upsert
+        assert mock_db.execute.call_count == 2
         assert mock_db.commit.called
         assert mock_db.close.called
 
-def test_aggregate_daily_stats_update():
+def test_aggregate_daily_stats_skips_when_locked():
     with patch("app.workers.tasks.SessionLocal") as mock_session_local:
         mock_db = MagicMock()
         mock_session_local.return_value = mock_db
-        mock_db.query().filter().first.return_value = MagicMock()  # Existing stats
-        mock_db.query().count.return_value = 5
-        mock_db.query().filter().count.return_value = 2
+        mock_db.get_bind().dialect.name = "postgresql"
+        mock_db.execute().scalar.return_value = False  # Another run holds the advisory lock
+        mock_db.execute.reset_mock()
         result = tasks.aggregate_daily_stats()
-        assert "Daily stats aggregated" in result
-        assert mock_db.commit.called
+        assert "already running" in result
+        assert mock_db.execute.call_count == 1
+        assert not mock_db.commit.called
         assert mock_db.close.called
 
 def test_aggregate_daily_stats_exception():
     with patch("app.workers.tasks.SessionLocal") as mock_session_local:
         mock_db = MagicMock()
         mock_session_local.return_value = mock_db
-        mock_db.query.side_effect = Exception("DB error")
+        mock_db.execute.side_effect = Exception("DB error")
         with pytest.raises(Exception):
             tasks.aggregate_daily_stats()
         assert mock_db.rollback.called
@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+import json
 from unittest.mock import AsyncMock
 from app.core.websocket import WebSocketManager
 
@@ -18,6 +19,7 @@ async def test_send_personal_message():
     ws = AsyncMock()
     await manager.connect(ws, "client2")
     await manager.send_personal_message("hello", "client2")
+    await manager.flush()
     ws.send_text.assert_called_with("hello")
 
 @pytest.mark.asyncio
@@ -28,6 +30,7 @@ async def test_broadcast():
     await manager.connect(ws1, "c1")
     await manager.connect(ws2, "c2")
     await manager.broadcast("msg")
+    await manager.flush()
     ws1.send_text.assert_called_with("msg")
     ws2.send_text.assert_called_with("msg")
 
@@ -37,4 +40,172 @@ async def test_broadcast_issue_update():
     ws = AsyncMock()
     await manager.connect(ws, "c3")
     await manager.broadcast_issue_update({"id": 1, "title": "Test"})
+    await manager.flush()
     ws.send_text.assert_called()
+
+@pytest.mark.asyncio
+async def test_broadcast_issue_update_sends_json():
+    import uuid
+    manager = WebSocketManager()
+    ws = AsyncMock()
+    await manager.connect(ws, "c4")
+    issue_id = uuid.uuid4()
+    await manager.broadcast_issue_update({"action": "created", "issue": {"id": issue_id}})
+    await manager.flush()
+    message = json.loads(ws.send_text.call_args[0][0])
+    assert message == {"type": "issue_update", "data": {"action": "created", "issue": {"id": str(issue_id)}}}
+
+@pytest.mark.asyncio
+async def test_broadcast_does_not_wait_for_slow_client():
+    manager = WebSocketManager(queue_size=2, send_timeout=5)
+    stalled = asyncio.Event()
+    slow, fast = AsyncMock(), AsyncMock()
+
+    async def stall(message):
+        await stalled.wait()
+
+    slow.send_text.side_effect = stall
+    await manager.connect(slow, "slow")
+    await manager.connect(fast, "fast")
+    for i in range(4):
+        await asyncio.wait_for(manager.broadcast(f"msg{i}"), 0.1)
+    await manager.flush()
+    # The slow client overflowed its queue and was dropped; the other got everything
+    assert list(manager.active_connections) == ["fast"]
+    assert [call.args[0] for call in fast.send_text.call_args_list] == ["msg0", "msg1", "msg2", "msg3"]
+    assert manager.stats()["dropped"] == 1
+    await asyncio.sleep(0)
+    slow.close.assert_called_with(code=1008)
+    stalled.set()
+
+@pytest.mark.asyncio
+async def test_dead_socket_is_dropped_without_affecting_others():
+    manager = WebSocketManager()
+    dead, alive = AsyncMock(), AsyncMock()
+    dead.send_text.side_effect = RuntimeError("socket closed")
+    await manager.connect(dead, "dead")
+    await manager.connect(alive, "alive")
+    await manager.broadcast("first")
+    await manager.flush()
+    assert list(manager.active_connections) == ["alive"]
+    await manager.broadcast("second")
+    await manager.flush()
+    assert [call.args[0] for call in alive.send_text.call_args_list] == ["first", "second"]
+
+@pytest.mark.asyncio
+async def test_stalled_send_times_out():
+    manager = WebSocketManager(send_timeout=0.05)
+    ws = AsyncMock()
+
+    async def stall(message):
+        await asyncio.sleep(10)
+
+    ws.send_text.side_effect = stall
+    await manager.connect(ws, "stalled")
+    await manager.broadcast("msg")
+    await asyncio.wait_for(manager.flush(), 1)
+    assert "stalled" not in manager.active_connections
+
+@pytest.mark.asyncio
+async def test_disconnect_ignores_replaced_socket():
+    manager = WebSocketManager()
+    old, new = AsyncMock(), AsyncMock()
+    await manager.connect(old, "c5")
+    await manager.connect(new, "c5")
+    # The old socket's handler finishing must not unregister the reconnected client
+    manager.disconnect("c5", old)
+    assert manager.active_connections["c5"].websocket is new
+
+@pytest.mark.asyncio
+async def test_in_process_backplane_is_default():
+    from app.core.websocket import InProcessBackplane
+    manager = WebSocketManager()
+    assert isinstance(manager.backplane, InProcessBackplane)
+    ws = AsyncMock()
+    await manager.connect(ws, "c6")
+    await manager.broadcast("local")
+    await manager.flush()
+    ws.send_text.assert_called_with("local")
+
+# A second worker: subscribes through its own manager, prints "ready", then prints the
+# first broadcast its client receives
+WORKER_SCRIPT = """
+import asyncio, sys
+from app.core.websocket import RedisBackplane, WebSocketManager
+
+class PrintingSocket:
+    def __init__(self):
+        self.received = asyncio.Event()
+    async def accept(self):
+        pass
+    async def send_text(self, message):
+        print(message, flush=True)
+        self.received.set()
+
+async def main():
+    manager = WebSocketManager(backplane=RedisBackplane(sys.argv[1], sys.argv[2]))
+    await manager.start()
+    socket = PrintingSocket()
+    await manager.connect(socket, "remote")
+    await asyncio.wait_for(manager.backplane.subscribed.wait(), 10)
+    print("ready", flush=True)
+    await asyncio.wait_for(socket.received.wait(), 10)
+    await manager.stop()
+
+asyncio.run(main())
+"""
+
+@pytest.mark.asyncio
+async def test_redis_backplane_delivers_across_workers():
+    import subprocess
+    import sys
+    import uuid
+    import redis
+    from app.core.config import settings
+    from app.core.websocket import RedisBackplane
+    try:
+        redis.Redis.from_url(settings.REDIS_URL).ping()
+    except redis.exceptions.RedisError:
+        pytest.skip("Redis is not reachable")
+
+    channel = f"test:websocket:{uuid.uuid4()}"
+    worker = subprocess.Popen(
+        [sys.executable, "-c", WORKER_SCRIPT, settings.REDIS_URL, channel],
+        stdout=subprocess.PIPE, text=True
+    )
+    manager = WebSocketManager(backplane=RedisBackplane(settings.REDIS_URL, channel))
+    try:
+        await manager.start()
+        local = AsyncMock()
+        await manager.connect(local, "local")
+        await asyncio.wait_for(manager.backplane.subscribed.wait(), 10)
+        ready = await asyncio.wait_for(asyncio.to_thread(worker.stdout.readline), 20)
+        assert ready.strip() == "ready"
+
+        await manager.broadcast_issue_update({"action": "created", "issue": {"id": "1"}})
+        received = await asyncio.wait_for(asyncio.to_thread(worker.stdout.readline), 10)
+        assert json.loads(received) == {"type": "issue_update", "data": {"action": "created", "issue": {"id": "1"}}}
+        assert worker.wait(timeout=10) == 0
+
+        # This worker's own client gets the message once, through its subscription
+        for _ in range(50):
+            if local.send_text.called:
+                break
+            await asyncio.sleep(0.05)
+        await manager.flush()
+        local.send_text.assert_called_once_with(received.strip())
+    finally:
+        worker.kill()
+        await manager.stop()
+
+@pytest.mark.asyncio
+async def test_redis_backplane_falls_back_to_local_delivery():
+    from app.core.websocket import RedisBackplane
+    manager = WebSocketManager(backplane=RedisBackplane("redis://127.0.0.1:1/0", "unreachable", retry_after=60))
+    await manager.start()
+    ws = AsyncMock()
+    await manager.connect(ws, "c7")
+    await manager.broadcast("still delivered")
+    await manager.flush()
+    ws.send_text.assert_called_once_with("still delivered")
+    await manager.stop()